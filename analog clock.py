@@ -1,20 +1,14 @@
 import tkinter as tk
+import argparse
 import time
 import math
-from datetime import datetime
-from hijri_converter import Gregorian
-import bangla  # ✅ Correct way to import
+from datetime import datetime, timedelta
+from neon_calendar import Ticker, to_bangla_digits, hijri_iso
 
 
-# Clock setup
-root = tk.Tk()
-root.title("🕒 Neon Analog Clock with Dates")
-
 canvas_size = 360
 center_x = center_y = canvas_size // 2
 clock_radius = canvas_size // 2 - 20
-canvas = tk.Canvas(root, width=canvas_size, height=canvas_size + 80, bg='black')
-canvas.pack()
 
 # Hour colors (different neon shades)
 hour_colors = [
@@ -22,80 +16,196 @@ hour_colors = [
     "#FFD700", "#DC143C", "#00CED1", "#FF69B4", "#ADFF2F", "#1E90FF"
 ]
 
-def draw_clock_face():
+# Hand lengths
+hour_length = clock_radius * 0.5
+minute_length = clock_radius * 0.7
+second_length = clock_radius * 0.9
+
+# Sin/cos for every tenth of a degree, so hands never call math.sin/cos
+TABLE_STEPS = 3600
+SIN = [math.sin(2 * math.pi * i / TABLE_STEPS) for i in range(TABLE_STEPS)]
+COS = [math.cos(2 * math.pi * i / TABLE_STEPS) for i in range(TABLE_STEPS)]
+
+SWEEP_FPS = 30
+
+def hand_end(length, turns):
+    """End of a hand `turns` of the way round the dial, clockwise from 12 o'clock."""
+    index = (int(turns * TABLE_STEPS + 0.5) - TABLE_STEPS // 4) % TABLE_STEPS
+    return center_x + length * COS[index], center_y + length * SIN[index]
+
+def date_texts(now_date):
+    """The three lines under the clock for a date."""
+    eng_date = now_date.strftime("%A, %d %B %Y")
+
+    # Bengali date as Bangla digits
+    bengali_date = to_bangla_digits(now_date.strftime("%d-%m-%Y"))
+
+    # Hijri date from the shared Umm al-Qura table
+    arabic_date = hijri_iso(now_date.toordinal())
+    return [f"Gregorian: {eng_date}", f"Bengali: {bengali_date}", f"Hijri: {arabic_date}"]
+
+class AnalogClock:
+    """Face, hands and dates created once; each tick only moves what changed.
+
+    Hands are moved with canvas.coords() and skipped when their end point
+    hasn't moved. The date lines are itemconfig()ed when the day rolls over.
+    In sweep mode the hands move smoothly SWEEP_FPS times a second instead
+    of jumping once a second.
+    """
+
+    def __init__(self, canvas, sweep=False):
+        self.canvas = canvas
+        self.sweep = sweep
+        self.draw_clock_face()
+
+        # Hands, created at 12 o'clock and moved on every tick
+        self.hands = [
+            (canvas.create_line(center_x, center_y, center_x, center_y - hour_length,
+                                fill="lime", width=6), hour_length),
+            (canvas.create_line(center_x, center_y, center_x, center_y - minute_length,
+                                fill="deepskyblue", width=4), minute_length),
+            (canvas.create_line(center_x, center_y, center_x, center_y - second_length,
+                                fill="magenta", width=2), second_length),
+        ]
+        self.hand_ends = [None, None, None]
+
+        # Show under clock
+        base_y = canvas_size + 10
+        self.date_items = [
+            canvas.create_text(center_x, base_y + 20 * i, text="", font=("Consolas", 10), fill=color)
+            for i, color in enumerate(['cyan', 'lime', 'magenta'])
+        ]
+        self.date_shown = None
+
+    def draw_clock_face(self):
+        # Outer circle
+        self.canvas.create_oval(center_x - clock_radius, center_y - clock_radius,
+                                center_x + clock_radius, center_y + clock_radius,
+                                outline="cyan", width=4)
+
+        for hour in range(1, 13):
+            x, y = hand_end(clock_radius - 30, hour / 12)
+            self.canvas.create_text(x, y, text=str(hour),
+                                    fill=hour_colors[hour - 1],
+                                    font=("Helvetica", 14, "bold"))
+
+    def update_hands(self, now):
+        hour = now.hour % 12
+        minute = now.minute
+        second = now.second
+        if self.sweep:
+            second += now.microsecond / 1e6
+            minute += second / 60
+
+        turns = [(hour + minute / 60) / 12, minute / 60, second / 60]
+        for i, ((item, length), turn) in enumerate(zip(self.hands, turns)):
+            end = hand_end(length, turn)
+            if end != self.hand_ends[i]:
+                self.canvas.coords(item, center_x, center_y, *end)
+                self.hand_ends[i] = end
+
+    def update_dates(self, now):
+        if now.date() == self.date_shown:
+            return
+        self.date_shown = now.date()
+        for item, text in zip(self.date_items, date_texts(now)):
+            self.canvas.itemconfig(item, text=text)
+
+    def update_clock(self):
+        now = datetime.now()
+        self.update_hands(now)
+        self.update_dates(now)
+
+# --- Benchmark ---
+class CountingCanvas:
+    """Stand-in for tk.Canvas that counts calls by method name."""
+    def __init__(self):
+        self.calls = {}
+        self.next_id = 0
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.next_id += 1
+            return self.next_id
+        return call
+
+def redraw_everything(canvas, now):
+    """What update_clock used to do every second: delete and recreate every item."""
     canvas.delete("clock_face")
-    # Outer circle
     canvas.create_oval(center_x - clock_radius, center_y - clock_radius,
                        center_x + clock_radius, center_y + clock_radius,
                        outline="cyan", width=4, tags="clock_face")
-
     for hour in range(1, 13):
         angle = math.radians(hour * 30 - 90)
-        x = center_x + math.cos(angle) * (clock_radius - 30)
-        y = center_y + math.sin(angle) * (clock_radius - 30)
-        canvas.create_text(x, y, text=str(hour),
-                           fill=hour_colors[hour - 1],
-                           font=("Helvetica", 14, "bold"),
-                           tags="clock_face")
-
-def draw_hands():
-    canvas.delete("hands")
-    now = datetime.now()
-    hour = now.hour % 12
-    minute = now.minute
-    second = now.second
-
-    # Angles
-    hour_angle = math.radians((hour + minute / 60) * 30 - 90)
-    minute_angle = math.radians(minute * 6 - 90)
-    second_angle = math.radians(second * 6 - 90)
-
-    # Hand lengths
-    hour_length = clock_radius * 0.5
-    minute_length = clock_radius * 0.7
-    second_length = clock_radius * 0.9
-
-    # Draw hands
-    canvas.create_line(center_x, center_y,
-                       center_x + hour_length * math.cos(hour_angle),
-                       center_y + hour_length * math.sin(hour_angle),
-                       fill="lime", width=6, tags="hands")
-
-    canvas.create_line(center_x, center_y,
-                       center_x + minute_length * math.cos(minute_angle),
-                       center_y + minute_length * math.sin(minute_angle),
-                       fill="deepskyblue", width=4, tags="hands")
-
-    canvas.create_line(center_x, center_y,
-                       center_x + second_length * math.cos(second_angle),
-                       center_y + second_length * math.sin(second_angle),
-                       fill="magenta", width=2, tags="hands")
-
-def draw_dates():
-    canvas.delete("date")
-    now_date = datetime.now()
-    eng_date = now_date.strftime("%A, %d %B %Y")
+        canvas.create_text(center_x + math.cos(angle) * (clock_radius - 30),
+                           center_y + math.sin(angle) * (clock_radius - 30), text=str(hour),
+                           fill=hour_colors[hour - 1], font=("Helvetica", 14, "bold"), tags="clock_face")
 
-    # Bengali date as Bangla digits
-    bengali_date = bangla.convert_english_digit_to_bangla_digit(now_date.strftime("%d-%m-%Y"))
-
-    # Hijri date using hijri_converter
-    arabic_date = Gregorian(now_date.year, now_date.month, now_date.day).to_hijri().isoformat()
+    canvas.delete("hands")
+    hour_angle = math.radians((now.hour % 12 + now.minute / 60) * 30 - 90)
+    minute_angle = math.radians(now.minute * 6 - 90)
+    second_angle = math.radians(now.second * 6 - 90)
+    for angle, length, color, width in ((hour_angle, hour_length, "lime", 6),
+                                        (minute_angle, minute_length, "deepskyblue", 4),
+                                        (second_angle, second_length, "magenta", 2)):
+        canvas.create_line(center_x, center_y, center_x + length * math.cos(angle),
+                           center_y + length * math.sin(angle), fill=color, width=width, tags="hands")
 
-    # Show under clock
+    canvas.delete("date")
+    import bangla
+    from hijri_converter import Gregorian
+    eng_date = now.strftime("%A, %d %B %Y")
+    bengali_date = bangla.convert_english_digit_to_bangla_digit(now.strftime("%d-%m-%Y"))
+    arabic_date = Gregorian(now.year, now.month, now.day).to_hijri().isoformat()
     base_y = canvas_size + 10
-    canvas.create_text(center_x, base_y, text=f"Gregorian: {eng_date}",
-                       font=("Consolas", 10), fill='cyan', tags="date")
-    canvas.create_text(center_x, base_y + 20, text=f"Bengali: {bengali_date}",
-                       font=("Consolas", 10), fill='lime', tags="date")
-    canvas.create_text(center_x, base_y + 40, text=f"Hijri: {arabic_date}",
-                       font=("Consolas", 10), fill='magenta', tags="date")
-
-def update_clock():
-    draw_clock_face()
-    draw_hands()
-    draw_dates()
-    root.after(1000, update_clock)
-
-update_clock()
-root.mainloop()
+    for i, (text, color) in enumerate(((f"Gregorian: {eng_date}", 'cyan'), (f"Bengali: {bengali_date}", 'lime'),
+                                       (f"Hijri: {arabic_date}", 'magenta'))):
+        canvas.create_text(center_x, base_y + 20 * i, text=text, font=("Consolas", 10), fill=color, tags="date")
+
+def benchmark(minutes=10):
+    """Tk calls and CPU time per minute: recreate-everything vs persistent items (tick and sweep)."""
+    start = datetime(2025, 3, 1, 23, 55)
+    results = {}
+    for mode in ("recreate", "tick", "sweep"):
+        canvas = CountingCanvas()
+        fps = SWEEP_FPS if mode == "sweep" else 1
+        frames = [start + timedelta(seconds=i / fps) for i in range(minutes * 60 * fps)]
+        if mode != "recreate":
+            clock = AnalogClock(canvas, sweep=mode == "sweep")
+            canvas.calls.clear() # Setup happens once; count the steady state
+        started = time.process_time()
+        for now in frames:
+            if mode == "recreate":
+                redraw_everything(canvas, now)
+            else:
+                clock.update_hands(now)
+                clock.update_dates(now)
+        cpu_ms = (time.process_time() - started) / minutes * 1e3
+        calls = sum(canvas.calls.values()) / minutes
+        results[mode] = (calls, cpu_ms)
+        detail = ", ".join(f"{name} {count / minutes:,.0f}" for name, count in sorted(canvas.calls.items()))
+        print(f"{mode:>8}: {calls:,.0f} Tk calls/min ({detail}), {cpu_ms:.1f} ms CPU/min")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Neon analog clock with Gregorian, Bengali and Hijri dates")
+    parser.add_argument("--sweep", action="store_true", help=f"smooth second hand, redrawn {SWEEP_FPS} times a second")
+    parser.add_argument("--bench", action="store_true", help="count Tk calls and CPU per minute, no window")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark()
+    else:
+        # Clock setup
+        root = tk.Tk()
+        root.title("🕒 Neon Analog Clock with Dates")
+        canvas = tk.Canvas(root, width=canvas_size, height=canvas_size + 80, bg='black')
+        canvas.pack()
+
+        clock = AnalogClock(canvas, sweep=args.sweep)
+        # Ticks land just after each second boundary (or sweep frame) instead of drifting
+        ticker = Ticker(root)
+        ticker.add(clock.update_clock, 1 / SWEEP_FPS if args.sweep else 1)
+        ticker.start()
+        root.mainloop()
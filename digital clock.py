@@ -1,8 +1,8 @@
 import tkinter as tk
-from datetime import datetime, timedelta
+from datetime import datetime
 from tkinter import font as tkfont
-import hijri_converter
-import pytz
+from neon_calendar import (SUNSET_HOUR, SUNRISE_HOUR, LabelSchedule, at_hours, at_sun, Ticker, Glow, Sun,
+                           get_timezone, english_time, bangla_time, gregorian_label, hijri_label, bengali_label)
 import locale
 
 class EnhancedNeonCalendarClock:
@@ -12,12 +12,9 @@ class EnhancedNeonCalendarClock:
         self.root.geometry("1000x800")
         self.root.configure(bg='#111111')
         
-        # Initialize glow effect variables first
-        self.glow_phase = 0
-        self.glow_direction = 1
-        
         # Set default timezone (Asia/Dhaka)
-        self.local_tz = pytz.timezone('Asia/Dhaka')
+        self.local_tz = get_timezone('Asia/Dhaka')
+        self.sun = Sun(self.local_tz)  # Dhaka's sunrise and sunset
         
         # Set locale to English for Gregorian dates
         try:
@@ -35,6 +32,10 @@ class EnhancedNeonCalendarClock:
             'border': ('#222222', '#444444', '#666666')   # Border shades
         }
         
+        # Glow effect on the time and date labels
+        self.glow = Glow({name: shades[0] for name, shades in self.colors.items()},
+                         ['time', 'bangla', 'hijri', 'bengali'], 0.1)
+        
         # Font configuration with fallbacks
         self.fonts = {
             'time': self.get_font("Arial", 100, "bold"),
@@ -54,8 +55,19 @@ class EnhancedNeonCalendarClock:
         self.create_time_display()
         self.create_calendar_display()
         
-        # Initial update
-        self.update_clock()
+        # Date labels only change at midnight, sunset and sunrise
+        self.date_labels = LabelSchedule()
+        self.date_labels.add(lambda text: self.gregorian_date.config(text=text), gregorian_label, at_hours(0))
+        self.date_labels.add(lambda text: self.hijri_date.config(text=text),
+                             lambda now: hijri_label(now, sun=self.sun), at_sun(self.sun, 'sunset', SUNSET_HOUR))
+        self.date_labels.add(lambda text: self.bengali_date.config(text=text),
+                             lambda now: bengali_label(now, sun=self.sun), at_sun(self.sun, 'sunrise', SUNRISE_HOUR))
+        
+        # Glow frames every 0.1 s, time on each new second
+        self.ticker = Ticker(self.root)
+        self.ticker.add(self.glow.tick, 0.1)
+        self.ticker.add(self.update_clock, 1)
+        self.ticker.start()
     
     def get_font(self, family, size, weight="normal", fallback=None):
         """Get font with fallback options"""
@@ -90,6 +102,7 @@ class EnhancedNeonCalendarClock:
             bg='black'
         )
         self.english_time.pack(pady=(10, 0))
+        self.glow.register('time', self.english_time)
         
         # Bangla time with shadow effect
         self.bangla_time = tk.Label(
@@ -99,6 +112,7 @@ class EnhancedNeonCalendarClock:
             bg='black'
         )
         self.bangla_time.pack(pady=(20, 0))
+        self.glow.register('bangla', self.bangla_time)
     
     def create_calendar_display(self):
         """Create the calendar display with better spacing"""
@@ -149,6 +163,7 @@ class EnhancedNeonCalendarClock:
             bg='black'
         )
         self.hijri_date.pack(pady=(5, 10))
+        self.glow.register('hijri', self.hijri_date)
         
         # Bengali calendar with transition note
         bengali_frame = tk.Frame(calendar_frame, bg='black', bd=2, relief=tk.RIDGE)
@@ -169,176 +184,18 @@ class EnhancedNeonCalendarClock:
             bg='black'
         )
         self.bengali_date.pack(pady=(5, 10))
-    
-    def to_bangla_digits(self, number):
-        """Convert to Bangla digits with proper formatting"""
-        bangla_digits = {
-            '0': '০', '1': '১', '2': '২', '3': '৩', '4': '৪',
-            '5': '৫', '6': '৬', '7': '৭', '8': '৮', '9': '৯'
-        }
-        return ''.join([bangla_digits.get(d, d) for d in str(number)])
+        self.glow.register('bengali', self.bengali_date)
     
     def get_local_time(self):
         """Get current local time with timezone"""
         return datetime.now(self.local_tz)
     
-    def get_hijri_date(self):
-        """Get accurate Hijri date with proper sunset transition (showing 1 day less)"""
-        now = self.get_local_time()
-        
-        # Calculate sunset time (simplified - in reality should use proper calculation)
-        sunset_hour = 18  # 6 PM as approximation
-        
-        # Get today's Gregorian date
-        gregorian_date = now.date()
-        
-        # Convert to Hijri and subtract 1 day
-        hijri = hijri_converter.Gregorian(
-            gregorian_date.year,
-            gregorian_date.month,
-            gregorian_date.day
-        ).to_hijri()
-        
-        # Subtract one day from the Hijri date
-        hijri_day = hijri.day - 1
-        hijri_month = hijri.month
-        hijri_year = hijri.year
-        
-        # Handle day underflow (previous month)
-        if hijri_day < 1:
-            hijri_month -= 1
-            if hijri_month < 1:
-                hijri_month = 12
-                hijri_year -= 1
-            # Get days in previous month
-            prev_month = hijri_converter.Hijri(hijri_year, hijri_month, 1)
-            hijri_day = prev_month.month_length()
-        
-        # Only show tomorrow's date if it's after sunset AND the Hijri date would actually change
-        if now.hour >= sunset_hour:
-            tomorrow = (now + timedelta(days=1)).date()
-            hijri_tomorrow = hijri_converter.Gregorian(
-                tomorrow.year,
-                tomorrow.month,
-                tomorrow.day
-            ).to_hijri()
-            
-            # Subtract one day from tomorrow's date
-            hijri_tomorrow_day = hijri_tomorrow.day - 1
-            hijri_tomorrow_month = hijri_tomorrow.month
-            hijri_tomorrow_year = hijri_tomorrow.year
-            
-            if hijri_tomorrow_day < 1:
-                hijri_tomorrow_month -= 1
-                if hijri_tomorrow_month < 1:
-                    hijri_tomorrow_month = 12
-                    hijri_tomorrow_year -= 1
-                # Get days in previous month
-                prev_month = hijri_converter.Hijri(hijri_tomorrow_year, hijri_tomorrow_month, 1)
-                hijri_tomorrow_day = prev_month.month_length()
-            
-            # Only use tomorrow's date if it's different
-            if hijri.day != hijri_tomorrow.day or hijri.month != hijri_tomorrow.month:
-                hijri_tomorrow = hijri_converter.Hijri(hijri_tomorrow_year, hijri_tomorrow_month, hijri_tomorrow_day)
-                return f"{hijri_tomorrow_day} {hijri_tomorrow.month_name()}, {hijri_tomorrow_year} AH"
-        
-        hijri = hijri_converter.Hijri(hijri_year, hijri_month, hijri_day)
-        return f"{hijri_day} {hijri.month_name()}, {hijri_year} AH"
-    
-    def get_bengali_date(self):
-        """Get Bengali date with proper sunrise transition"""
-        now = self.get_local_time()
-        
-        # Calculate sunrise time (simplified - 6 AM as approximation)
-        sunrise_hour = 6
-        
-        # If current time is after sunrise, use today's date
-        if now.hour >= sunrise_hour:
-            gregorian_date = now.date()
-        else:
-            gregorian_date = (now - timedelta(days=1)).date()
-        
-        bangla_months = [
-            'বৈশাখ', 'জ্যৈষ্ঠ', 'আষাঢ়', 'শ্রাবণ',
-            'ভাদ্র', 'আশ্বিন', 'কার্তিক', 'অগ্রহায়ণ',
-            'পৌষ', 'মাঘ', 'ফাল্গুন', 'চৈত্র'
-        ]
-        
-        # Calculate Bengali year (1429 = 2022-2023)
-        if (gregorian_date.month > 4) or (gregorian_date.month == 4 and gregorian_date.day >= 14):
-            bengali_year = gregorian_date.year - 593
-        else:
-            bengali_year = gregorian_date.year - 594
-            
-        # Calculate Bengali month and day
-        month_offset = 3 if gregorian_date.day > 13 else 4
-        bengali_month = (gregorian_date.month - month_offset) % 12
-        if bengali_month == 0:
-            bengali_month = 12
-            
-        bengali_day = gregorian_date.day - 13 if gregorian_date.day > 13 else (31 if gregorian_date.month-1 in [0,2,4,6,7,9,11] else 30) - (13 - gregorian_date.day)
-        
-        return f"{self.to_bangla_digits(bengali_day)} {bangla_months[bengali_month-1]}, {self.to_bangla_digits(bengali_year)}"
-    
-    def update_glow_effect(self):
-        """Update the glow effect animation"""
-        self.glow_phase += 0.1 * self.glow_direction
-        if self.glow_phase >= 1:
-            self.glow_direction = -1
-        elif self.glow_phase <= 0:
-            self.glow_direction = 1
-        
-        # Update colors based on glow phase
-        for color_name in self.colors:
-            base_color = self.colors[color_name][0]
-            r, g, b = [int(base_color[i:i+2], 16) for i in (1, 3, 5)]
-            r = min(255, int(r * (0.8 + 0.2 * self.glow_phase)))
-            g = min(255, int(g * (0.8 + 0.2 * self.glow_phase)))
-            b = min(255, int(b * (0.8 + 0.2 * self.glow_phase)))
-            glow_color = f"#{r:02x}{g:02x}{b:02x}"
-            self.colors[color_name] = (base_color, glow_color, base_color)
-    
     def update_clock(self):
-        """Update all displays with animations"""
+        """Update the time, and the dates when they can change"""
         local_time = self.get_local_time()
-        
-        # Update glow effect
-        self.update_glow_effect()
-        
-        # Update time displays with glow
-        self.english_time.config(
-            text=local_time.strftime("%I:%M:%S %p"),
-            fg=self.colors['time'][1]
-        )
-        
-        # Bangla time with glow
-        hour = self.to_bangla_digits(local_time.strftime("%I"))
-        minute = self.to_bangla_digits(local_time.strftime("%M"))
-        second = self.to_bangla_digits(local_time.strftime("%S"))
-        ampm = "PM" if local_time.strftime("%p") == "PM" else "AM"
-        self.bangla_time.config(
-            text=f"{hour}:{minute}:{second} {ampm}",
-            fg=self.colors['bangla'][1]
-        )
-        
-        # Update calendar displays
-        # Force English locale for Gregorian date
-        self.gregorian_date.config(text=local_time.strftime("%A, %B %d, %Y"))
-        
-        # Hijri date with glow (showing 1 day less)
-        self.hijri_date.config(
-            text=self.get_hijri_date(),
-            fg=self.colors['hijri'][1]
-        )
-        
-        # Bengali date with glow
-        self.bengali_date.config(
-            text=self.get_bengali_date(),
-            fg=self.colors['bengali'][1]
-        )
-        
-        # Schedule next update
-        self.root.after(100, self.update_clock)
+        self.english_time.config(text=english_time(local_time))
+        self.bangla_time.config(text=bangla_time(local_time))
+        self.date_labels.update(local_time)
 
 if __name__ == "__main__":
     root = tk.Tk()
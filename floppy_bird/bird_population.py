@@ -0,0 +1,169 @@
+import random
+import time
+
+import numpy as np
+
+from bird_sim import (HEIGHT, FPS, GRAVITY, BIRD_JUMP, PIPE_GAP, PIPE_WIDTH, PIPE_FREQUENCY_TICKS,
+                      Bird, PipePool, FlappySim, simple_bot)
+
+class PopulationSim:
+    """Many birds flying through one shared pipe stream, stepped with NumPy.
+
+    Every bird gets the same pipes (same seed as FlappySim), so a controller's
+    fitness only depends on how it flies. Bird y, velocity, alive and score
+    are arrays; a tick is a handful of array operations for the whole
+    population. Physics and collisions match FlappySim exactly.
+    """
+
+    def __init__(self, num_birds, seed=None):
+        self.num_birds = num_birds
+        self.seed = seed
+        template = Bird()
+        self.bird_x = template.x
+        self.radius = template.radius
+        self.pipe_pool = PipePool()
+        self.pipes = self.pipe_pool.active
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+        self.y = np.full(self.num_birds, float(HEIGHT // 2))
+        self.velocity = np.zeros(self.num_birds)
+        self.alive = np.ones(self.num_birds, dtype=bool)
+        self.score = np.zeros(self.num_birds, dtype=np.int64)
+        self.ticks_alive = np.zeros(self.num_birds, dtype=np.int64)
+        self.pipe_pool.clear()
+        self.ticks = 0
+        self.last_pipe_tick = 0
+
+    @property
+    def done(self):
+        return not self.alive.any()
+
+    def step(self, flaps=None):
+        """Advance one tick; flaps is a bool array (or None for no flaps). Returns alive."""
+        if self.done:
+            return self.alive
+        alive = self.alive
+        self.ticks += 1
+
+        # Bird update, for the living birds only
+        if flaps is not None:
+            self.velocity[flaps & alive] = BIRD_JUMP
+        velocity = np.where(alive, self.velocity + GRAVITY, self.velocity)
+        y = np.where(alive, self.y + velocity, self.y)
+
+        # Keep birds on screen
+        floor = HEIGHT - self.radius
+        clamped = (y > floor) | (y < self.radius)
+        np.clip(y, self.radius, floor, out=y)
+        velocity[clamped] = 0
+        self.y, self.velocity = y, velocity
+
+        # Pipe generation
+        if self.ticks - self.last_pipe_tick > PIPE_FREQUENCY_TICKS:
+            self.pipe_pool.spawn(self.rng)
+            self.last_pipe_tick = self.ticks
+
+        # Bird rects as pygame would build them (Rect truncates floats)
+        top = (y - self.radius).astype(np.int64)
+        bottom = top + self.radius * 2
+        left = self.bird_x - self.radius
+        right = left + self.radius * 2
+
+        hit = np.zeros(self.num_birds, dtype=bool)
+        passed = 0
+        for pipe in self.pipes:
+            pipe.update()
+            # Every bird shares x, so only pipes over the bird column are tested
+            if pipe.x < right and pipe.x + PIPE_WIDTH > left:
+                for rect in (pipe.top_pipe, pipe.bottom_pipe):
+                    if rect.h > 0:
+                        hit |= (top < rect.bottom) & (bottom > rect.top)
+
+            # Check if pipe passed
+            if not pipe.passed and pipe.x < self.bird_x:
+                pipe.passed = True
+                passed += 1
+
+        # Remove off-screen pipes
+        self.pipe_pool.retire(-50)
+
+        self.score[alive] += passed
+        self.ticks_alive[alive] += 1
+        self.alive = alive & ~hit & (y < floor)
+        return self.alive
+
+    def observations(self):
+        """Per-bird inputs for a controller: y, velocity, distance to and centre of the next gap."""
+        gap_x, gap_y = HEIGHT, HEIGHT / 2
+        for pipe in self.pipes:
+            if pipe.x + PIPE_WIDTH >= self.bird_x - self.radius:
+                gap_x, gap_y = pipe.x - self.bird_x, pipe.height + PIPE_GAP / 2
+                break
+        obs = np.empty((self.num_birds, 4))
+        obs[:, 0] = self.y
+        obs[:, 1] = self.velocity
+        obs[:, 2] = gap_x
+        obs[:, 3] = gap_y
+        return obs
+
+    def run(self, controller, max_ticks=100_000):
+        """Play until every bird is dead; controller(sim) returns a bool array of flaps."""
+        while not self.done and self.ticks < max_ticks:
+            self.step(controller(self))
+        return self.score
+
+def linear_controller(weights, bias):
+    """Flap when obs @ weights + bias > 0; one row of weights per bird."""
+    def controller(sim):
+        return np.einsum('ij,ij->i', sim.observations(), weights) + bias > 0
+    return controller
+
+def population_bot(sim):
+    """simple_bot's rule for the whole population at once."""
+    gap_y = sim.observations()[:, 3]
+    return (sim.y > gap_y + 20) & (sim.velocity >= 0)
+
+# --- Benchmark ---
+def benchmark(num_birds=2000, ticks=FPS * 30, seed=0):
+    """Bird-steps/sec of the population sim against per-object Bird.update + Pipe.collide."""
+    # Per-object: one Bird each, same pipe stream, same rule as simple_bot
+    rng = np.random.default_rng(seed)
+    jitter = rng.uniform(-40, 40, num_birds)
+    loop_birds = min(num_birds, 200) # the object loop is slow; time a slice of the population
+    sims = [FlappySim(seed) for _ in range(loop_birds)]
+    for sim, dy in zip(sims, jitter):
+        sim.bird.y += dy
+    start = time.perf_counter()
+    steps = 0
+    for _ in range(ticks):
+        for sim in sims:
+            if not sim.game_over:
+                sim.step(simple_bot(sim))
+                steps += 1
+    loop_rate = steps / (time.perf_counter() - start)
+
+    pop = PopulationSim(num_birds, seed)
+    pop.y += jitter
+    start = time.perf_counter()
+    steps = 0
+    for _ in range(ticks):
+        steps += int(pop.alive.sum())
+        pop.step(population_bot(pop))
+    pop_rate = steps / (time.perf_counter() - start)
+
+    # Same start, same rule: every bird must end exactly like its FlappySim twin
+    ticks_alive = [sim.ticks for sim in sims]
+    assert list(pop.ticks_alive[:loop_birds]) == ticks_alive, "population sim diverged from FlappySim"
+    assert list(pop.score[:loop_birds]) == [sim.score for sim in sims], "population scores diverged"
+
+    print(f"per-object loop: {loop_rate:,.0f} bird-steps/sec ({loop_birds} birds)")
+    print(f"population sim:  {pop_rate:,.0f} bird-steps/sec ({num_birds} birds), "
+          f"{pop_rate / loop_rate:.1f}x faster")
+    return loop_rate, pop_rate
+
+if __name__ == "__main__":
+    benchmark()
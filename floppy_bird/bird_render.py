@@ -0,0 +1,186 @@
+import os
+import time
+
+import pygame
+
+from bird_sim import WIDTH, HEIGHT, FlappySim, Bird, simple_bot
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+SKY_BLUE = (135, 206, 235)
+RED = (255, 0, 0)
+YELLOW = (255, 255, 0)
+ORANGE = (255, 165, 0)
+
+# --- Sprites ---
+def draw_bird_shape(surface, x, y, radius):
+    """The bird's circle, eye and beak with its centre at (x, y)."""
+    pygame.draw.circle(surface, YELLOW, (x, y), radius)
+    # Draw eye
+    pygame.draw.circle(surface, BLACK, (x + 5, y - 3), 3)
+    # Draw beak
+    pygame.draw.polygon(surface, ORANGE, [(x + 15, y), (x + 25, y), (x + 15, y + 5)])
+
+def render_bird_sprite(radius):
+    """Pre-render the bird once; it is blitted at (x - radius, y - radius) every frame."""
+    sprite = pygame.Surface((radius + 26, radius * 2 + 1), pygame.SRCALPHA)
+    draw_bird_shape(sprite, radius, radius, radius)
+    return sprite.convert_alpha()
+
+class Renderer:
+    """Draws floppy bird frames from surfaces that are rendered once and reused.
+
+    Text that can end up over a pipe keeps its alpha (convert_alpha()). Text
+    that only ever sits on the plain sky is rendered onto the sky colour and
+    convert()ed, which blits faster. Score texts are cached by value, so
+    font.render() only runs when a score changes.
+    """
+
+    def __init__(self, screen, font, small_font):
+        self.screen = screen
+        self.font = font
+        self.small_font = small_font
+        self.bird_radius = Bird().radius
+        self.bird_sprite = render_bird_sprite(self.bird_radius)
+
+        self.game_over_texts = [
+            (self.overlay_text(font, "Game Over!", RED), HEIGHT // 2 - 50),
+            (self.overlay_text(small_font, "Press SPACE to play again"), HEIGHT // 2 + 50),
+            (self.overlay_text(small_font, "Press E to export scores to Excel"), HEIGHT // 2 + 80),
+        ]
+        self.name_title = self.sky_text(font, "Enter your name:")
+        self.start_hint = self.sky_text(small_font, "Press ENTER to start")
+        self.high_scores_title = self.sky_text(font, "High Scores")
+        self.continue_hint = self.sky_text(small_font, "Press SPACE to continue")
+        self.score_texts = {} # (label, value) -> surface
+        self.name_texts = {}
+
+    def overlay_text(self, font, text, color=BLACK):
+        return font.render(text, True, color).convert_alpha()
+
+    def sky_text(self, font, text, color=BLACK):
+        return font.render(text, True, color, SKY_BLUE).convert()
+
+    def blit_centered(self, surface, y):
+        self.screen.blit(surface, (WIDTH // 2 - surface.get_width() // 2, y))
+
+    def score_text(self, label, value):
+        surface = self.score_texts.get((label, value))
+        if surface is None:
+            if len(self.score_texts) > 1000:
+                self.score_texts.clear()
+            surface = self.score_texts[(label, value)] = self.overlay_text(self.font, f"{label}: {value}")
+        return surface
+
+    # --- Game screen ---
+    def draw_bird(self, bird):
+        self.screen.blit(self.bird_sprite, (bird.x - self.bird_radius, int(bird.y) - self.bird_radius))
+
+    def draw_pipe(self, pipe):
+        self.screen.fill(GREEN, pipe.top_pipe)
+        self.screen.fill(GREEN, pipe.bottom_pipe)
+
+    def draw_score(self, score, high_score):
+        self.screen.blit(self.score_text("Score", score), (10, 10))
+        self.screen.blit(self.score_text("High", high_score), (10, 50))
+
+    def draw_game_over(self):
+        for surface, y in self.game_over_texts:
+            self.blit_centered(surface, y)
+
+    def draw_game(self, sim, high_score, game_over=False):
+        self.screen.fill(SKY_BLUE)
+        for pipe in sim.pipes:
+            self.draw_pipe(pipe)
+        self.draw_bird(sim.bird)
+        self.draw_score(sim.score, high_score)
+        if game_over:
+            self.draw_game_over()
+
+    # --- Menus ---
+    def draw_name_input(self, player_name):
+        name_surface = self.name_texts.get(player_name)
+        if name_surface is None:
+            name_surface = self.name_texts[player_name] = self.sky_text(self.font, player_name)
+
+        self.screen.fill(SKY_BLUE)
+        self.blit_centered(self.name_title, HEIGHT // 2 - 50)
+        pygame.draw.rect(self.screen, BLACK, (WIDTH // 2 - 100, HEIGHT // 2, 200, 40), 2)
+        self.blit_centered(name_surface, HEIGHT // 2 + 5)
+        self.blit_centered(self.start_hint, HEIGHT // 2 + 60)
+
+    def draw_high_scores(self, rows):
+        self.screen.fill(SKY_BLUE)
+        self.blit_centered(self.high_scores_title, 50)
+        y_pos = 120
+        for i, (name, scr, date) in enumerate(rows, 1):
+            self.blit_centered(self.sky_text(self.small_font, f"{i}. {name}: {scr} ({date})"), y_pos)
+            y_pos += 40
+        self.blit_centered(self.continue_hint, HEIGHT - 50)
+
+# --- Benchmark ---
+def draw_game_uncached(screen, font, sim, high_score):
+    """The old per-frame drawing: bird primitives and font.render() every frame."""
+    screen.fill(SKY_BLUE)
+    for pipe in sim.pipes:
+        pygame.draw.rect(screen, GREEN, pipe.top_pipe)
+        pygame.draw.rect(screen, GREEN, pipe.bottom_pipe)
+    draw_bird_shape(screen, sim.bird.x, int(sim.bird.y), sim.bird.radius)
+    screen.blit(font.render(f"Score: {sim.score}", True, BLACK), (10, 10))
+    screen.blit(font.render(f"High: {high_score}", True, BLACK), (10, 50))
+
+def benchmark(frames=3000, seed=0):
+    """Draw time per frame, uncached vs cached, as a share of the 60 and 240 FPS budgets."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.SysFont('Arial', 30)
+    renderer = Renderer(screen, font, pygame.font.SysFont('Arial', 20))
+
+    times = {}
+    for name in ("uncached", "cached"):
+        sim = FlappySim(seed)
+        drawing = 0.0
+        for _ in range(frames):
+            if sim.game_over:
+                sim.reset()
+            sim.step(simple_bot(sim))
+            start = time.perf_counter()
+            if name == "uncached":
+                draw_game_uncached(screen, font, sim, 42)
+            else:
+                renderer.draw_game(sim, 42)
+            drawing += time.perf_counter() - start
+        times[name] = drawing / frames
+        if name == "uncached":
+            reference = pygame.image.tostring(screen, "RGB")
+
+    # Same final game state, so both paths must have drawn the same picture
+    same = pygame.image.tostring(screen, "RGB") == reference
+
+    # Just the parts the cache replaces: the bird and the two score lines
+    start = time.perf_counter()
+    for i in range(frames):
+        draw_bird_shape(screen, sim.bird.x, int(sim.bird.y), sim.bird.radius)
+        screen.blit(font.render(f"Score: {i % 50}", True, BLACK), (10, 10))
+        screen.blit(font.render(f"High: {42}", True, BLACK), (10, 50))
+    sprites_uncached = (time.perf_counter() - start) / frames
+    start = time.perf_counter()
+    for i in range(frames):
+        renderer.draw_bird(sim.bird)
+        renderer.draw_score(i % 50, 42)
+    sprites_cached = (time.perf_counter() - start) / frames
+
+    for name, seconds in times.items():
+        print(f"{name:>8}: {seconds * 1e3:.3f} ms/frame, "
+              + ", ".join(f"{seconds * fps * 100:.1f}% of a {fps} FPS frame" for fps in (60, 240)))
+    print(f"bird + score text: {sprites_uncached * 1e6:.1f} us uncached, {sprites_cached * 1e6:.1f} us cached")
+    print(f"cached drawing is {times['uncached'] / times['cached']:.2f}x faster; "
+          f"frames {'identical' if same else 'DIFFER'}")
+    pygame.quit()
+    return times
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,307 @@
+import collections
+import random
+import time
+
+import pygame # Only pygame.Rect is used here; nothing opens a window
+
+# Game constants
+WIDTH, HEIGHT = 400, 600
+FPS = 60
+GRAVITY = 0.25
+BIRD_JUMP = -5
+PIPE_SPEED = 3
+PIPE_GAP = 150
+PIPE_FREQUENCY = 1500  # milliseconds
+PIPE_WIDTH = 50
+
+# Physics runs in fixed ticks of 1/FPS seconds, so pipe spawns are counted in ticks
+TICK_SECONDS = 1 / FPS
+PIPE_FREQUENCY_TICKS = PIPE_FREQUENCY * FPS // 1000
+
+class Bird:
+    def __init__(self):
+        self.x = 100
+        self.y = HEIGHT // 2
+        self.velocity = 0
+        self.radius = 15
+
+    def update(self):
+        # Apply gravity
+        self.velocity += GRAVITY
+        self.y += self.velocity
+
+        # Keep bird on screen
+        if self.y > HEIGHT - self.radius:
+            self.y = HEIGHT - self.radius
+            self.velocity = 0
+        if self.y < self.radius:
+            self.y = self.radius
+            self.velocity = 0
+
+    def jump(self):
+        self.velocity = BIRD_JUMP
+
+    def get_mask(self):
+        return pygame.Rect(self.x - self.radius, self.y - self.radius,
+                          self.radius * 2, self.radius * 2)
+
+class Pipe:
+    __slots__ = ('x', 'height', 'top_pipe', 'bottom_pipe', 'passed')
+
+    def __init__(self, rng=random):
+        self.top_pipe = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        self.bottom_pipe = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        self.respawn(rng)
+
+    def respawn(self, rng=random):
+        """Move this pipe back to the right edge with a new gap, reusing its rects."""
+        self.x = WIDTH
+        self.height = rng.randint(100, HEIGHT - 200)
+        self.top_pipe.update(self.x, 0, PIPE_WIDTH, self.height)
+        self.bottom_pipe.update(self.x, self.height + PIPE_GAP, PIPE_WIDTH, HEIGHT - self.height - PIPE_GAP)
+        self.passed = False
+
+    def update(self, speed=PIPE_SPEED):
+        self.x -= speed
+        self.top_pipe.x = self.x
+        self.bottom_pipe.x = self.x
+
+    def collide(self, bird):
+        bird_rect = bird.get_mask()
+        return bird_rect.colliderect(self.top_pipe) or bird_rect.colliderect(self.bottom_pipe)
+
+class PipePool:
+    """On-screen pipes in a deque, oldest (leftmost) first, plus spares for reuse.
+
+    Pipes always spawn at the right edge and move at the same speed, so they
+    stay sorted by x: new pipes go on the back and off-screen pipes come off
+    the front into the spares. Once a few pipes have been made, spawning
+    only re-rolls a spare's gap and nothing else is allocated.
+    """
+
+    def __init__(self):
+        self.active = collections.deque()
+        self.spares = []
+
+    def spawn(self, rng=random):
+        if self.spares:
+            pipe = self.spares.pop()
+            pipe.respawn(rng)
+        else:
+            pipe = Pipe(rng)
+        self.active.append(pipe)
+        return pipe
+
+    def retire(self, min_x):
+        """Move pipes from the front to the spares while they are left of min_x."""
+        active = self.active
+        while active and active[0].x < min_x:
+            self.spares.append(active.popleft())
+
+    def clear(self):
+        self.spares.extend(self.active)
+        self.active.clear()
+
+# --- Simulation ---
+class FlappySim:
+    """Display-free floppy bird that advances one fixed tick per step().
+
+    Pipe heights come from a seeded RNG and pipe spawns are counted in ticks
+    rather than wall-clock milliseconds, so the same seed and the same flaps
+    always give exactly the same game, at any speed.
+    """
+
+    def __init__(self, seed=None, pipe_speed=PIPE_SPEED, pipe_interval=PIPE_FREQUENCY_TICKS):
+        self.seed = seed
+        self.pipe_speed = pipe_speed
+        self.pipe_interval = pipe_interval
+        self.pipe_pool = PipePool()
+        self.pipes = self.pipe_pool.active # Sorted by x, for drawing and bots
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+        self.bird = Bird()
+        self.pipe_pool.clear()
+        self.score = 0
+        self.ticks = 0
+        self.last_pipe_tick = 0
+        self.game_over = False
+
+    def step(self, flap=False):
+        """Advance one tick; returns True while the bird is still alive."""
+        if self.game_over:
+            return False
+        if flap:
+            self.bird.jump()
+        self.ticks += 1
+
+        # Bird update
+        self.bird.update()
+
+        hit, passed = self.update_pipes()
+        self.score += passed
+        if hit:
+            self.game_over = True
+
+        # Check if bird hit the ground
+        if self.bird.y >= HEIGHT - self.bird.radius:
+            self.game_over = True
+        return not self.game_over
+
+    def update_pipes(self):
+        """Spawn, move and retire pipes; returns (bird hit a pipe, pipes passed this tick)."""
+        pipes, bird = self.pipes, self.bird
+
+        # Pipe generation
+        if self.ticks - self.last_pipe_tick > self.pipe_interval:
+            self.pipe_pool.spawn(self.rng)
+            self.last_pipe_tick = self.ticks
+
+        # Pipes are sorted by x, so only the front one or two can reach the bird
+        hit = False
+        passed = 0
+        speed = self.pipe_speed
+        bird_right = bird.x + bird.radius
+        bird_rect = None
+        for pipe in pipes:
+            pipe.update(speed)
+            if pipe.x >= bird_right:
+                continue
+            if bird_rect is None:
+                bird_rect = bird.get_mask()
+            if bird_rect.colliderect(pipe.top_pipe) or bird_rect.colliderect(pipe.bottom_pipe):
+                hit = True
+            # Check if pipe passed
+            if not pipe.passed and pipe.x < bird.x:
+                pipe.passed = True
+                passed += 1
+
+        # Remove off-screen pipes
+        self.pipe_pool.retire(-50)
+        return hit, passed
+
+    def state(self):
+        """Everything that defines the current game, for determinism checks."""
+        return (self.ticks, self.score, self.game_over, self.bird.y, self.bird.velocity,
+                tuple((pipe.x, pipe.height, pipe.passed) for pipe in self.pipes))
+
+    def run(self, controller, max_ticks=100_000):
+        """Play until the bird dies; controller(sim) returns True to flap."""
+        while not self.game_over and self.ticks < max_ticks:
+            self.step(controller(self))
+        return self.score
+
+# --- Fixed Timestep ---
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed physics ticks.
+
+    Leftover time carries over to the next frame. After a long stall at most
+    max_steps ticks are run, so the game slows down instead of spiralling.
+    """
+
+    def __init__(self, step_seconds=TICK_SECONDS, max_steps=5):
+        self.step_seconds = step_seconds
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, elapsed_seconds):
+        """Add a frame's elapsed time and return how many ticks to run now."""
+        self.accumulator += elapsed_seconds
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_seconds
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+
+# --- Bots and benchmark ---
+def simple_bot(sim):
+    """Flap when the bird drops below the middle of the next pipe gap."""
+    target = HEIGHT // 2
+    for pipe in sim.pipes:
+        if pipe.x + PIPE_WIDTH >= sim.bird.x - sim.bird.radius:
+            target = pipe.height + PIPE_GAP / 2
+            break
+    return sim.bird.y > target + 20 and sim.bird.velocity >= 0
+
+def benchmark(games=200, seed=0):
+    """Run bot games headless and report speed relative to real time."""
+    rng = random.Random(seed)
+    ticks = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        sim = FlappySim(rng.getrandbits(32))
+        sim.run(simple_bot, max_ticks=FPS * 60)
+        ticks += sim.ticks
+    elapsed = time.perf_counter() - start
+
+    # Same seed, same inputs: the replayed game must match exactly
+    a, b = FlappySim(seed), FlappySim(seed)
+    a.run(simple_bot, max_ticks=FPS * 60)
+    b.run(simple_bot, max_ticks=FPS * 60)
+    assert a.state() == b.state(), "simulation is not deterministic"
+
+    print(f"{games} games, {ticks:,} ticks in {elapsed:.2f}s: {ticks / elapsed:,.0f} ticks/sec, "
+          f"{ticks / elapsed / FPS:,.0f}x real time")
+    return ticks / elapsed
+
+def list_update_pipes(sim, pipes):
+    """The old list-based pipe update, kept for pipe_benchmark() to compare against."""
+    if sim.ticks - sim.last_pipe_tick > sim.pipe_interval:
+        pipes.append(Pipe(sim.rng))
+        sim.last_pipe_tick = sim.ticks
+    hit = False
+    passed = 0
+    for pipe in pipes[:]:
+        pipe.update(sim.pipe_speed)
+        if pipe.collide(sim.bird):
+            hit = True
+        if not pipe.passed and pipe.x < sim.bird.x:
+            pipe.passed = True
+            passed += 1
+        if pipe.x < -50:
+            pipes.remove(pipe)
+    return hit, passed
+
+def pipe_benchmark(ticks=200_000, pipe_speed=12, pipe_interval=10, seed=0):
+    """Time and Pipe allocations of the pipe update, list vs pool, with fast dense pipes.
+
+    The bird is parked mid-screen and collisions are counted but not fatal,
+    so both versions do exactly the same pipe work on every tick.
+    """
+    results = {}
+    for name in ("list", "pool"):
+        sim = FlappySim(seed, pipe_speed, pipe_interval)
+        pipes = []
+        update = (lambda: list_update_pipes(sim, pipes)) if name == "list" else sim.update_pipes
+        hits = passes = spawns = 0
+        start = time.perf_counter()
+        for _ in range(ticks):
+            sim.ticks += 1
+            hit, passed = update()
+            hits += hit
+            passes += passed
+            spawns += sim.last_pipe_tick == sim.ticks
+        elapsed = time.perf_counter() - start
+
+        # The list version builds a Pipe (and two Rects) per spawn; the pool only until it is warm
+        created = spawns if name == "list" else len(sim.pipe_pool.active) + len(sim.pipe_pool.spares)
+        results[name] = (elapsed / ticks * 1e6, hits, passes)
+        print(f"{name}: {elapsed / ticks * 1e6:.2f} us/tick, {created:,} Pipe objects for {spawns:,} spawns "
+              f"({hits:,} hit ticks, {passes:,} passes)")
+
+    assert results["list"][1:] == results["pool"][1:], "pooled and list pipes disagree"
+    print(f"pool is {results['list'][0] / results['pool'][0]:.2f}x faster "
+          f"at {pipe_speed} px/tick with a pipe every {pipe_interval + 1} ticks")
+    return results
+
+if __name__ == "__main__":
+    benchmark()
+    pipe_benchmark()
@@ -0,0 +1,106 @@
+import heapq
+import os
+import random
+import tempfile
+import time
+
+class Leaderboard:
+    """In-memory best score per player plus the current top N.
+
+    The top N live in a min-heap of (score, player), so a new score only
+    has to beat the weakest entry: updates are O(log N) and reading the
+    leaderboard never touches the disk.
+    """
+
+    def __init__(self, size=5):
+        self.size = size
+        self.best = {} # player -> (score, date)
+        self.heap = [] # (score, player) of the current top players, weakest first
+        self.in_top = set()
+        self.sorted_top = None # Cached top() result until the next change
+
+    @classmethod
+    def from_rows(cls, rows, size=5):
+        """Build from (player, score, date) rows, e.g. ScoreStore.all_scores()."""
+        board = cls(size)
+        for player, score, date in rows:
+            if player not in board.best or score > board.best[player][0]:
+                board.best[player] = (score, date)
+        board.heap = heapq.nlargest(size, ((s, p) for p, (s, _) in board.best.items()))
+        heapq.heapify(board.heap)
+        board.in_top = {player for _, player in board.heap}
+        return board
+
+    def update(self, player, score, date=""):
+        """Record a score; returns True if it was the player's new best."""
+        if player in self.best and score <= self.best[player][0]:
+            return False
+        self.best[player] = (score, date)
+
+        if player in self.in_top:
+            # Already on the board: swap in the new score (N is small)
+            self.heap = [(score if p == player else s, p) for s, p in self.heap]
+            heapq.heapify(self.heap)
+        elif len(self.heap) < self.size:
+            heapq.heappush(self.heap, (score, player))
+            self.in_top.add(player)
+        elif (score, player) > self.heap[0]:
+            _, dropped = heapq.heapreplace(self.heap, (score, player))
+            self.in_top.discard(dropped)
+            self.in_top.add(player)
+        else:
+            return True
+
+        self.sorted_top = None
+        return True
+
+    def top(self):
+        """Top players as (player, score, date), highest first."""
+        if self.sorted_top is None:
+            self.sorted_top = [(p, s, self.best[p][1]) for s, p in sorted(self.heap, reverse=True)]
+        return self.sorted_top
+
+    def best_score(self, player):
+        return self.best.get(player, (0, ""))[0]
+
+def benchmark(players=100_000, updates=100_000, seed=0):
+    """Time building, updating and reading the leaderboard against SQLite queries."""
+    from score_store import ScoreStore
+
+    rng = random.Random(seed)
+    rows = [(f"player{i}", rng.randint(0, 500), "2025-01-01 00:00:00") for i in range(players)]
+
+    start = time.perf_counter()
+    board = Leaderboard.from_rows(rows)
+    load_ms = (time.perf_counter() - start) * 1e3
+
+    names = [f"player{rng.randrange(players)}" for _ in range(updates)]
+    scores = [rng.randint(0, 600) for _ in range(updates)]
+    start = time.perf_counter()
+    for name, score in zip(names, scores):
+        board.update(name, score)
+    update_us = (time.perf_counter() - start) / updates * 1e6
+
+    start = time.perf_counter()
+    for i in range(1000):
+        board.update(names[i], scores[i] + 1) # Invalidate the cache like a real save would
+        board.top()
+    top_us = (time.perf_counter() - start) / 1000 * 1e6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ScoreStore(os.path.join(tmp, "bench.db"), os.path.join(tmp, "none.xlsx"))
+        for row in rows:
+            store.submit(row[0], row[1], row[2])
+        store.flush()
+        start = time.perf_counter()
+        for _ in range(100):
+            store.top(5)
+        sqlite_us = (time.perf_counter() - start) / 100 * 1e6
+        store.close()
+
+    print(f"{players:,} players: load {load_ms:.1f} ms, update {update_us:.2f} us, "
+          f"top() {top_us:.2f} us (SQLite top 5: {sqlite_us:.0f} us)")
+    return {"load_ms": load_ms, "update_us": update_us, "top_us": top_us, "sqlite_top_us": sqlite_us}
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,158 @@
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+
+DB_FILE = "floppy_bird_scores.db"
+EXCEL_FILE = "floppy_bird_scores.xlsx"
+SHEET_NAME = "High Scores"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    player TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+"""
+
+# Keep only the best score per player
+UPSERT = """
+INSERT INTO scores (player, score, date) VALUES (?, ?, ?)
+ON CONFLICT (player) DO UPDATE SET score = excluded.score, date = excluded.date
+WHERE excluded.score > scores.score
+"""
+
+class ScoreStore:
+    """High scores in SQLite, written by a background thread.
+
+    submit() only puts the score on a queue, so the game loop never waits for
+    the disk. The Excel sheet is no longer the source of truth: export_excel()
+    regenerates it on demand.
+    """
+
+    def __init__(self, db_file=DB_FILE, excel_file=EXCEL_FILE):
+        self.db_file = db_file
+        self.excel_file = excel_file
+
+        conn = self.connect()
+        with conn:
+            conn.executescript(SCHEMA)
+        # First run after the switch: bring over the scores from the old Excel file
+        if conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0] == 0 and os.path.exists(excel_file):
+            self.import_excel(conn)
+        conn.close()
+
+        self.tasks = queue.Queue()
+        self.worker = threading.Thread(target=self.run_worker, name="score-writer", daemon=True)
+        self.worker.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.db_file)
+        conn.execute("PRAGMA journal_mode=WAL") # Readers don't block the writer thread
+        return conn
+
+    def import_excel(self, conn):
+        from openpyxl import load_workbook
+
+        try:
+            ws = load_workbook(self.excel_file, read_only=True)[SHEET_NAME]
+            rows = [(row[0], int(row[1]), str(row[2] or ""))
+                    for row in ws.iter_rows(min_row=2, values_only=True) if row[0] and row[1]]
+        except Exception as e:
+            print(f"Error reading Excel file: {e}")
+            return
+        with conn:
+            conn.executemany(UPSERT, rows)
+
+    # --- Background worker ---
+    def run_worker(self):
+        conn = self.connect()
+        while True:
+            task = self.tasks.get()
+            try:
+                if task is None:
+                    break
+                kind, args = task
+                if kind == "score":
+                    with conn:
+                        conn.execute(UPSERT, args)
+                elif kind == "export":
+                    self.write_excel(conn, *args)
+            except Exception as e:
+                print(f"Error saving scores: {e}")
+            finally:
+                self.tasks.task_done()
+        conn.close()
+
+    def submit(self, player_name, score, date=None):
+        """Queue a score to be saved; returns immediately."""
+        date = date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.tasks.put(("score", (player_name, score, date)))
+
+    def request_export(self, path=None):
+        """Queue a rewrite of the Excel sheet after any pending scores."""
+        self.tasks.put(("export", (path or self.excel_file,)))
+
+    def flush(self):
+        """Wait until every queued task has been written."""
+        self.tasks.join()
+
+    def close(self):
+        self.tasks.put(None)
+        self.worker.join()
+
+    # --- Reading ---
+    def top(self, n=5):
+        """Best n scores as (player, score, date), highest first."""
+        self.flush()
+        conn = self.connect()
+        try:
+            return conn.execute(
+                "SELECT player, score, date FROM scores ORDER BY score DESC LIMIT ?", (n,)).fetchall()
+        finally:
+            conn.close()
+
+    def all_scores(self):
+        """Every player's best score as (player, score, date)."""
+        self.flush()
+        conn = self.connect()
+        try:
+            return conn.execute("SELECT player, score, date FROM scores").fetchall()
+        finally:
+            conn.close()
+
+    # --- Excel export ---
+    def export_excel(self, path=None):
+        """Regenerate the Excel sheet now, sorted by score."""
+        self.flush()
+        conn = self.connect()
+        try:
+            self.write_excel(conn, path or self.excel_file)
+        finally:
+            conn.close()
+
+    def write_excel(self, conn, path):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = SHEET_NAME
+        ws.append(["Player Name", "Score", "Date"])
+        # Style the headers
+        for cell in ws[1]:
+            cell.font = Font(bold=True)
+        for row in conn.execute("SELECT player, score, date FROM scores ORDER BY score DESC"):
+            ws.append(list(row))
+        wb.save(path)
+
+if __name__ == "__main__":
+    # python score_store.py [output.xlsx] - export the leaderboard to Excel
+    store = ScoreStore()
+    target = sys.argv[1] if len(sys.argv) > 1 else EXCEL_FILE
+    store.export_excel(target)
+    store.close()
+    print(f"Exported high scores to {target}")
@@ -0,0 +1,198 @@
+import collections
+import csv
+import json
+import time
+
+PHASES = ["update", "draw", "present"]
+FRAME_FIELDS = ["frame", "time", "interval"] + PHASES + ["work", "ticks", "quality"]
+
+# --- Frame Telemetry ---
+class FrameTelemetry:
+    """Per-frame update/draw/present times and stall events for the game loop.
+
+    The loop calls begin_frame(), then mark(phase) after each phase and
+    end_frame() at the end. The last `capacity` frames and `max_stalls` stall
+    events are kept in ring buffers, so memory stays flat on a kiosk that runs
+    for days. A stall is a frame interval, or a note()d operation, longer
+    than `stall_threshold` seconds.
+    """
+
+    def __init__(self, fps=60, capacity=3600, stall_threshold=0.1, max_stalls=256):
+        self.clock = time.perf_counter
+        self.budget = 1 / fps
+        self.stall_threshold = stall_threshold
+        self.frames = collections.deque(maxlen=capacity) # Tuples in FRAME_FIELDS order
+        self.stalls = collections.deque(maxlen=max_stalls) # (frame, time, seconds, what)
+        self.frame = 0
+        self.dropped = 0 # Frame slots missed because a frame took longer than the budget
+        self.origin = self.clock()
+        self.frame_start = None
+        self.last_mark = None
+        self.interval = 0.0
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+
+    def begin_frame(self):
+        now = self.clock()
+        self.interval = now - self.frame_start if self.frame_start is not None else self.budget
+        self.frame_start = self.last_mark = now
+        for phase in PHASES:
+            self.phase_times[phase] = 0.0
+
+    def mark(self, phase):
+        now = self.clock()
+        self.phase_times[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self, ticks=0, quality=0):
+        work = self.last_mark - self.frame_start
+        self.frames.append((self.frame, self.frame_start - self.origin, self.interval,
+                            *(self.phase_times[phase] for phase in PHASES), work, ticks, quality))
+        if self.interval > self.budget * 1.5:
+            self.dropped += round(self.interval / self.budget) - 1
+        if self.interval > self.stall_threshold:
+            slowest = max(PHASES, key=self.phase_times.get)
+            self.stalls.append((self.frame, self.frame_start - self.origin, self.interval, f"frame ({slowest})"))
+        self.frame += 1
+        return work
+
+    def resume(self):
+        """Restart the current frame's clock, e.g. after a menu that waited for a key."""
+        self.begin_frame()
+        self.interval = self.budget
+
+    def note(self, what, seconds):
+        """Record an operation outside the frame phases if it took long enough to be a stall."""
+        if seconds > self.stall_threshold:
+            self.stalls.append((self.frame, self.clock() - self.origin, seconds, what))
+
+    # --- Statistics ---
+    def percentile(self, field, pct, frames=None):
+        index = FRAME_FIELDS.index(field)
+        values = sorted(frame[index] for frame in (self.frames if frames is None else frames))
+        if not values:
+            return 0.0
+        return values[round((len(values) - 1) * pct / 100)]
+
+    def summary(self, recent=None):
+        """Counts, FPS and p50/p95/p99 per phase over the buffer, or its last `recent` frames."""
+        frames = list(self.frames)[-recent:] if recent else self.frames
+        intervals = sum(frame[2] for frame in frames)
+        over_budget = sum(1 for frame in frames if frame[FRAME_FIELDS.index("work")] > self.budget)
+        summary = {
+            "frames": self.frame,
+            "recorded": len(frames),
+            "fps": len(frames) / intervals if intervals else 0.0,
+            "dropped": self.dropped,
+            "over_budget": over_budget,
+            "stalls": len(self.stalls),
+        }
+        for field in ["interval", "work"] + PHASES:
+            for pct in (50, 95, 99):
+                summary[f"{field}_p{pct}_ms"] = self.percentile(field, pct, frames) * 1e3
+        return summary
+
+    # --- Output ---
+    def write_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(FRAME_FIELDS)
+            writer.writerows(self.frames)
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump({
+                "summary": self.summary(),
+                "stalls": [dict(zip(["frame", "time", "seconds", "what"], stall)) for stall in self.stalls],
+                "frames": [dict(zip(FRAME_FIELDS, frame)) for frame in self.frames],
+            }, f, indent=1)
+
+    def overlay_lines(self, recent=120):
+        s = self.summary(recent)
+        return [
+            f"{s['fps']:.1f} FPS  work p95 {s['work_p95_ms']:.2f} ms",
+            f"upd {s['update_p95_ms']:.2f}  draw {s['draw_p95_ms']:.2f}  present {s['present_p95_ms']:.2f}",
+            f"dropped {s['dropped']}  stalls {s['stalls']}",
+        ]
+
+class Overlay:
+    """Telemetry text in the corner of the screen, toggled with a key.
+
+    The text is only re-rendered every `refresh` frames; in between the same
+    surfaces are blitted.
+    """
+
+    def __init__(self, font, color=(0, 0, 0), refresh=30):
+        self.font = font
+        self.color = color
+        self.refresh = refresh
+        self.visible = False
+        self.surfaces = []
+        self.frames = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.frames = 0
+
+    def draw(self, screen, telemetry, extra=()):
+        if not self.visible:
+            return
+        if self.frames % self.refresh == 0:
+            lines = telemetry.overlay_lines() + list(extra)
+            self.surfaces = [self.font.render(line, True, self.color) for line in lines]
+        self.frames += 1
+        y = screen.get_height() - 5 - sum(s.get_height() for s in self.surfaces)
+        for surface in self.surfaces:
+            screen.blit(surface, (screen.get_width() - surface.get_width() - 5, y))
+            y += surface.get_height()
+
+# --- Adaptive Quality ---
+class AdaptiveQuality:
+    """Trades render rate for frame time when frames run over budget.
+
+    Off until toggle()d. Every `window` drawn frames the p90 work time is
+    compared with the budget. Over budget, the level goes up and only every
+    (level + 1)-th frame is drawn and presented. Physics still runs every
+    tick, so the game plays the same, only less smoothly. Well under budget,
+    the level comes back down.
+    """
+
+    def __init__(self, budget, max_level=2, window=60, high=0.9, low=0.5):
+        self.budget = budget
+        self.max_level = max_level
+        self.window = window
+        self.high = high
+        self.low = low
+        self.level = 0
+        self.enabled = False
+        self.work = []
+        self.frame = 0
+
+    def should_draw(self):
+        """Whether this frame is drawn at the current level."""
+        self.frame += 1
+        return not self.enabled or self.frame % (self.level + 1) == 0
+
+    def record(self, work_seconds, drawn):
+        if not self.enabled:
+            return
+        # Frames that skipped drawing would hide the cost, so only drawn ones count
+        if drawn:
+            self.work.append(work_seconds)
+        if len(self.work) < self.window:
+            return
+        self.work.sort()
+        p90 = self.work[int(len(self.work) * 0.9)]
+        self.work.clear()
+        # A drawn frame may take up to level + 1 frame slots
+        if p90 > self.budget * self.high * (self.level + 1) and self.level < self.max_level:
+            self.level += 1
+        elif p90 < self.budget * self.low * self.level:
+            self.level -= 1
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.level = 0
+        self.work.clear()
+
+    def status(self):
+        return f"adaptive level {self.level}" if self.enabled else "adaptive off"
@@ -0,0 +1,11 @@
+"""Calendar conversions shared by the clocks and the screensaver."""
+
+from .tables import (FIRST_DATE, LAST_DATE, HIJRI_MONTHS, BANGLA_MONTHS, CalendarTable,
+                     get_table, hijri_date, bengali_date, ordinals_from_datetime64)
+from .labels import LabelSchedule, at_hours, at_sun
+from .ticker import Ticker
+from .formatting import (SUNSET_HOUR, SUNRISE_HOUR, HIJRI_OFFSET, to_bangla_digits, get_timezone,
+                         english_time, bangla_time, gregorian_label, hijri_label, bengali_label,
+                         hijri_text, bengali_text, hijri_iso)
+from .glow import Glow
+from .solar import DHAKA, Sun, solar_minutes, solar_minutes_array
@@ -0,0 +1,130 @@
+import time
+from datetime import timedelta
+from functools import lru_cache
+
+from .tables import HIJRI_MONTHS, BANGLA_MONTHS, hijri_date, bengali_date
+
+# Fallbacks when there's no Sun to ask, or it doesn't rise or set that day
+SUNSET_HOUR = 18  # 6 PM as approximation
+SUNRISE_HOUR = 6
+HIJRI_OFFSET = -1  # Show 1 day less than the Umm al-Qura tables
+
+BANGLA_DIGITS = str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯')
+
+def to_bangla_digits(number):
+    return str(number).translate(BANGLA_DIGITS)
+
+# --- Times ---
+def get_timezone(name):
+    """Standard library zoneinfo; pytz only where there's no tz database to read."""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except (ImportError, LookupError):
+        import pytz
+        return pytz.timezone(name)
+
+def english_time(now):
+    return now.strftime("%I:%M:%S %p")
+
+def bangla_time(now):
+    ampm = "PM" if now.hour >= 12 else "AM"
+    return f"{to_bangla_digits(now.strftime('%I:%M:%S'))} {ampm}"
+
+# --- Dates ---
+# A day's text is the same all day, so each one is only formatted once
+@lru_cache(maxsize=64)
+def hijri_text(ordinal):
+    year, month, day = hijri_date(ordinal)
+    return f"{day} {HIJRI_MONTHS[month - 1]}, {year} AH"
+
+@lru_cache(maxsize=64)
+def bengali_text(ordinal):
+    year, month, day = bengali_date(ordinal)
+    return f"{to_bangla_digits(day)} {BANGLA_MONTHS[month - 1]}, {to_bangla_digits(year)}"
+
+@lru_cache(maxsize=64)
+def hijri_iso(ordinal):
+    year, month, day = hijri_date(ordinal)
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+def gregorian_label(now):
+    return now.strftime("%A, %B %d, %Y")
+
+def hijri_label(now, offset=HIJRI_OFFSET, sunset_hour=SUNSET_HOUR, sun=None):
+    """Hijri date that turns over at sunset: the Sun's if given (now must be aware), else sunset_hour."""
+    day = now.date().toordinal() + offset
+    sunset = sun.sunset(now) if sun else None
+    # After sunset the Hijri day has already changed
+    after_sunset = now >= sunset if sunset else now.hour >= sunset_hour
+    if after_sunset:
+        day += 1
+    return hijri_text(day)
+
+def bengali_label(now, sunrise_hour=SUNRISE_HOUR, sun=None):
+    """Bengali date that turns over at sunrise, in Bangla digits."""
+    day = now.date().toordinal()
+    sunrise = sun.sunrise(now) if sun else None
+    before_sunrise = now < sunrise if sunrise else now.hour < sunrise_hour
+    if before_sunrise:
+        day -= 1
+    return bengali_text(day)
+
+# --- Benchmark ---
+def benchmark(seconds=86_400, seed=0):
+    """Every label for a day of per-second ticks: the old per-front-end code vs this module."""
+    import random
+    from datetime import datetime
+
+    bangla_digits = {
+        '0': '০', '1': '১', '2': '২', '3': '৩', '4': '৪',
+        '5': '৫', '6': '৬', '7': '৭', '8': '৮', '9': '৯'
+    }
+    def old_to_bangla_digits(number):
+        return ''.join([bangla_digits.get(d, d) for d in str(number)])
+
+    def old_labels(now):
+        # What each front-end did on its own, per tick
+        hour = old_to_bangla_digits(now.strftime("%I"))
+        minute = old_to_bangla_digits(now.strftime("%M"))
+        second = old_to_bangla_digits(now.strftime("%S"))
+        ampm = "PM" if now.strftime("%p") == "PM" else "AM"
+        day = now.date().toordinal() + HIJRI_OFFSET + (now.hour >= SUNSET_HOUR)
+        hijri_year, hijri_month, hijri_day = hijri_date(day)
+        bengali_day = now.date() if now.hour >= SUNRISE_HOUR else (now - timedelta(days=1)).date()
+        bengali_year, bengali_month, bengali_dom = bengali_date(bengali_day)
+        return (now.strftime("%I:%M:%S %p"), f"{hour}:{minute}:{second} {ampm}",
+                now.strftime("%A, %B %d, %Y"),
+                f"{hijri_day} {HIJRI_MONTHS[hijri_month - 1]}, {hijri_year} AH",
+                f"{old_to_bangla_digits(bengali_dom)} {BANGLA_MONTHS[bengali_month-1]}, {old_to_bangla_digits(bengali_year)}")
+
+    def new_labels(now):
+        return (english_time(now), bangla_time(now), gregorian_label(now), hijri_label(now), bengali_label(now))
+
+    start = datetime(2025, 3, 1, 0, 0)
+    ticks = [start + timedelta(seconds=i) for i in range(seconds)]
+    for labels in (old_labels, new_labels):
+        labels(start) # Build the table block outside the timing
+
+    rng = random.Random(seed)
+    numbers = [rng.randrange(10 ** 6) for _ in range(100_000)]
+    results = {}
+    for name, digits in (("dict join", old_to_bangla_digits), ("translate", to_bangla_digits)):
+        started = time.perf_counter()
+        for number in numbers:
+            digits(number)
+        results[name] = (time.perf_counter() - started) / len(numbers) * 1e6
+        print(f"to_bangla_digits, {name:>9}: {results[name]:.2f} us")
+
+    for name, labels in (("old", old_labels), ("shared", new_labels)):
+        started = time.perf_counter()
+        texts = [labels(now) for now in ticks]
+        results[name] = (time.perf_counter() - started) / seconds * 1e6
+        results[name + " texts"] = texts
+        print(f"all five labels, {name:>6}: {results[name]:.2f} us per tick")
+    assert results["old texts"] == results["shared texts"], "labels differ"
+    print(f"same text for every second of the day; {results['old'] / results['shared']:.1f}x faster")
+    return results
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,43 @@
+class Glow:
+    """Pulses every registered label between 80% and 100% of its role's colour.
+
+    The colour for each step of the pulse is worked out once per role, and
+    tick() only calls config() for roles whose colour actually changed
+    since the last step, so no widget is ever read back from Tk.
+    """
+
+    def __init__(self, colors, roles, speed=0.05):
+        self.labels = {role: [] for role in roles}
+        self.shown = dict.fromkeys(roles)
+        # Phase goes 0 -> 1 -> 0 in steps of `speed`
+        rising = [min(1.0, i * speed) for i in range(int(round(1 / speed)) + 1)]
+        phases = rising + rising[-2:0:-1]
+        self.table = {role: [self.glow_color(colors[role], phase) for phase in phases] for role in roles}
+        self.step = 0
+        self.steps = len(phases)
+
+    @staticmethod
+    def glow_color(base_color, phase):
+        r, g, b = [int(base_color[i:i+2], 16) for i in (1, 3, 5)]
+        r = min(255, int(r * (0.8 + 0.2 * phase)))
+        g = min(255, int(g * (0.8 + 0.2 * phase)))
+        b = min(255, int(b * (0.8 + 0.2 * phase)))
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+    def register(self, role, label):
+        """Make a label glow with its role; anything that isn't a role is ignored."""
+        if role in self.labels:
+            self.labels[role].append(label)
+
+    def tick(self):
+        """Advance one step; returns how many config() calls were made."""
+        self.step = (self.step + 1) % self.steps
+        calls = 0
+        for role, colors in self.table.items():
+            color = colors[self.step]
+            if color != self.shown[role]:
+                self.shown[role] = color
+                for label in self.labels[role]:
+                    label.config(fg=color)
+                    calls += 1
+        return calls
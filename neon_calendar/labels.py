@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+def at_hours(*hours):
+    """next_change function for text that can only change at the top of these hours."""
+    hours = sorted(set(hours))
+
+    def next_change(wall):
+        midnight = wall.replace(hour=0, minute=0, second=0, microsecond=0)
+        for day in (0, 1):
+            for hour in hours:
+                instant = midnight + timedelta(days=day, hours=hour)
+                if instant > wall:
+                    return instant
+    return next_change
+
+def at_sun(sun, event, fallback_hour):
+    """next_change function for text that changes at midnight and at the Sun's `event` ('sunrise' or 'sunset').
+
+    Days the sun doesn't rise or set use fallback_hour instead.
+    """
+    def next_change(wall):
+        midnight = wall.replace(hour=0, minute=0, second=0, microsecond=0)
+        candidates = []
+        for day in (0, 1):
+            start = midnight + timedelta(days=day)
+            # Far north the event can fall after midnight, so both days count
+            instant = getattr(sun, event)(start)
+            instant = instant.replace(tzinfo=None) if instant else start + timedelta(hours=fallback_hour)
+            candidates += [start, instant]
+        return min(instant for instant in candidates if instant > wall)
+    return next_change
+
+class LabelSchedule:
+    """Labels whose text only changes at known instants, e.g. dates at midnight or sunset.
+
+    Each entry has a compute(now) function for the text, a setter that puts
+    text on screen, and a next_change(wall) function that returns the next
+    local wall-clock instant at which the text could change. update(now)
+    recomputes an entry only once that instant has passed, and only calls the
+    setter if the text is actually different. If the clock jumps backwards,
+    the entry is recomputed right away.
+    """
+
+    def __init__(self):
+        self.entries = [] # [setter, compute, next_change, computed_at, due, text]
+
+    def add(self, setter, compute, next_change):
+        self.entries.append([setter, compute, next_change, None, None, None])
+
+    def update(self, now):
+        """Refresh whatever is due at `now`; returns how many labels changed."""
+        wall = now.replace(tzinfo=None)
+        changed = 0
+        for entry in self.entries:
+            setter, compute, next_change, computed_at, due, text = entry
+            if due is not None and computed_at <= wall < due:
+                continue
+            new_text = compute(now)
+            if new_text != text:
+                setter(new_text)
+                entry[5] = new_text
+                changed += 1
+            entry[3] = wall
+            entry[4] = next_change(wall)
+        return changed
+
+    def invalidate(self):
+        """Recompute every label on the next update, e.g. after a settings change."""
+        for entry in self.entries:
+            entry[4] = None
+
+    def next_due(self):
+        return min((entry[4] for entry in self.entries if entry[4] is not None), default=None)
@@ -0,0 +1,162 @@
+import math
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+
+DHAKA = (23.8103, 90.4125)  # Latitude, longitude
+
+# The sun's centre 50' below the horizon: refraction plus the sun's radius
+ZENITH = math.radians(90.833)
+UNIX_EPOCH = date(1970, 1, 1).toordinal()
+
+def solar_minutes(ordinal, latitude, longitude):
+    """(sunrise, sunset) in minutes after 00:00 UTC on a day number (date.toordinal()).
+
+    NOAA's sunrise equation, good to a minute or two away from the poles.
+    Either value is None when the sun doesn't rise or doesn't set that day.
+    """
+    day = date.fromordinal(ordinal)
+    days_in_year = 366 if day.year % 4 == 0 and (day.year % 100 != 0 or day.year % 400 == 0) else 365
+    # Fractional year at noon, in radians
+    g = 2 * math.pi / days_in_year * (day.timetuple().tm_yday - 1)
+    eqtime = 229.18 * (0.000075 + 0.001868 * math.cos(g) - 0.032077 * math.sin(g)
+                       - 0.014615 * math.cos(2 * g) - 0.040849 * math.sin(2 * g))
+    decl = (0.006918 - 0.399912 * math.cos(g) + 0.070257 * math.sin(g) - 0.006758 * math.cos(2 * g)
+            + 0.000907 * math.sin(2 * g) - 0.002697 * math.cos(3 * g) + 0.00148 * math.sin(3 * g))
+    lat = math.radians(latitude)
+    cos_ha = math.cos(ZENITH) / (math.cos(lat) * math.cos(decl)) - math.tan(lat) * math.tan(decl)
+    if not -1 <= cos_ha <= 1:
+        return None, None
+    ha = math.degrees(math.acos(cos_ha))
+    noon = 720 - 4 * longitude - eqtime
+    return noon - 4 * ha, noon + 4 * ha
+
+def solar_minutes_array(ordinals, latitude, longitude):
+    """solar_minutes for a NumPy array of day numbers; (sunrise, sunset) arrays, NaN where there's none."""
+    import numpy as np
+
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    days = (ordinals - UNIX_EPOCH).astype('datetime64[D]')
+    years = days.astype('datetime64[Y]')
+    day_of_year = (days - years).astype(np.int64)
+    days_in_year = ((years + 1).astype('datetime64[D]') - years.astype('datetime64[D]')).astype(np.int64)
+    g = 2 * np.pi / days_in_year * day_of_year
+    eqtime = 229.18 * (0.000075 + 0.001868 * np.cos(g) - 0.032077 * np.sin(g)
+                       - 0.014615 * np.cos(2 * g) - 0.040849 * np.sin(2 * g))
+    decl = (0.006918 - 0.399912 * np.cos(g) + 0.070257 * np.sin(g) - 0.006758 * np.cos(2 * g)
+            + 0.000907 * np.sin(2 * g) - 0.002697 * np.cos(3 * g) + 0.00148 * np.sin(3 * g))
+    lat = np.radians(latitude)
+    cos_ha = np.cos(ZENITH) / (np.cos(lat) * np.cos(decl)) - np.tan(lat) * np.tan(decl)
+    ha = np.degrees(np.arccos(np.where(np.abs(cos_ha) <= 1, cos_ha, np.nan)))
+    noon = 720 - 4 * longitude - eqtime
+    return noon - 4 * ha, noon + 4 * ha
+
+class Sun:
+    """Sunrise and sunset for one place, as datetimes in its timezone.
+
+    Days are kept in an LRU of `cache_size` days. A miss works out the whole
+    year around that day at once, so a clock that asks every tick does a
+    real calculation about once a year; every other call is a dict lookup.
+    """
+
+    def __init__(self, tz, latitude=DHAKA[0], longitude=DHAKA[1], cache_size=800):
+        self.tz = tz
+        self.latitude = latitude
+        self.longitude = longitude
+        self.cache_size = cache_size
+        self.days = OrderedDict() # Day number -> (sunrise, sunset)
+        self.misses = 0
+
+    def instant(self, ordinal, minutes):
+        if minutes is None:
+            return None
+        utc = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(days=ordinal - UNIX_EPOCH, minutes=minutes)
+        return utc.astimezone(self.tz)
+
+    def precompute_year(self, year):
+        for ordinal in range(date(year, 1, 1).toordinal(), date(year + 1, 1, 1).toordinal()):
+            sunrise, sunset = solar_minutes(ordinal, self.latitude, self.longitude)
+            self.days[ordinal] = (self.instant(ordinal, sunrise), self.instant(ordinal, sunset))
+        while len(self.days) > self.cache_size:
+            self.days.popitem(last=False)
+
+    def times(self, day):
+        """(sunrise, sunset) for a date, datetime or day number; either may be None near the poles."""
+        ordinal = day if isinstance(day, int) else day.toordinal()
+        try:
+            self.days.move_to_end(ordinal)
+        except KeyError:
+            self.misses += 1
+            self.precompute_year(date.fromordinal(ordinal).year)
+        return self.days[ordinal]
+
+    def sunrise(self, day):
+        return self.times(day)[0]
+
+    def sunset(self, day):
+        return self.times(day)[1]
+
+    def year_table(self, year):
+        """Sunrise and sunset minutes after local midnight for every day of a year, vectorized.
+
+        Each day uses the timezone's UTC offset at 12:00 UTC that day.
+        """
+        import numpy as np
+
+        first, last = date(year, 1, 1).toordinal(), date(year + 1, 1, 1).toordinal()
+        ordinals = np.arange(first, last)
+        sunrise, sunset = solar_minutes_array(ordinals, self.latitude, self.longitude)
+        offsets = np.array([self.instant(o, 12 * 60).utcoffset().total_seconds() / 60 for o in range(first, last)])
+        return ordinals, sunrise + offsets, sunset + offsets
+
+# --- Benchmark ---
+def benchmark(ticks=100_000, years=200):
+    """Cached lookups per tick, year tables, and how far the old 6 AM / 6 PM guesses were off."""
+    import numpy as np
+
+    from .formatting import get_timezone, SUNRISE_HOUR, SUNSET_HOUR
+
+    sun = Sun(get_timezone('Asia/Dhaka'))
+    for day in (date(2025, 3, 20), date(2025, 6, 21), date(2025, 12, 21)):
+        sunrise, sunset = sun.times(day)
+        print(f"Dhaka {day}: sunrise {sunrise:%H:%M}, sunset {sunset:%H:%M}")
+
+    # Scalar and vectorized versions must agree, polar days included
+    for latitude, longitude in (DHAKA, (51.5, -0.13), (78.2, 15.6), (-33.9, 151.2)):
+        ordinals = np.arange(date(2024, 1, 1).toordinal(), date(2026, 1, 1).toordinal())
+        rises, sets = solar_minutes_array(ordinals, latitude, longitude)
+        for ordinal, rise, set_ in zip(ordinals.tolist(), rises, sets):
+            scalar = solar_minutes(ordinal, latitude, longitude)
+            assert (scalar[0] is None) == np.isnan(rise) and (scalar[0] is None or abs(scalar[0] - rise) < 1e-6)
+            assert (scalar[1] is None) == np.isnan(set_) and (scalar[1] is None or abs(scalar[1] - set_) < 1e-6)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        solar_minutes(739000, *DHAKA)
+    uncached_us = (time.perf_counter() - start) / ticks * 1e6
+    now = datetime(2025, 3, 1, 12, tzinfo=sun.tz)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        now >= sun.sunset(now)
+    cached_us = (time.perf_counter() - start) / ticks * 1e6
+    fresh = Sun(sun.tz)
+    start = time.perf_counter()
+    fresh.precompute_year(2030)
+    year_ms = (time.perf_counter() - start) * 1e3
+    ordinals = np.arange(date(1950, 1, 1).toordinal(), date(1950 + years, 1, 1).toordinal())
+    start = time.perf_counter()
+    solar_minutes_array(ordinals, *DHAKA)
+    array_s = time.perf_counter() - start
+
+    print(f"per tick: sunset check {cached_us:.2f} us cached, {uncached_us:.2f} us calculated")
+    print(f"year precompute (on a cache miss): {year_ms:.1f} ms")
+    print(f"vectorized: {len(ordinals):,} days in {array_s * 1e3:.1f} ms ({len(ordinals) / array_s / 1e6:.1f}M days/sec)")
+
+    _, sunrise, sunset = sun.year_table(2025)
+    rise_off = np.abs(sunrise - SUNRISE_HOUR * 60)
+    set_off = np.abs(sunset - SUNSET_HOUR * 60)
+    print(f"2025 in Dhaka, the old fixed hours vs the sun: sunrise off by {rise_off.mean():.0f} min on average "
+          f"(max {rise_off.max():.0f}), sunset by {set_off.mean():.0f} min (max {set_off.max():.0f})")
+
+if __name__ == "__main__":
+    benchmark()
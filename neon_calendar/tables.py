@@ -0,0 +1,214 @@
+import time
+from array import array
+from bisect import bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Every Gregorian day hijri_converter supports (its Umm al-Qura range).
+# hijri_converter itself is only imported when the table is first used, so importing this module costs next to nothing at startup.
+FIRST_DATE = date(1924, 8, 1)
+LAST_DATE = date(2077, 11, 16)
+FIRST_ORDINAL = FIRST_DATE.toordinal()
+LAST_ORDINAL = LAST_DATE.toordinal()
+
+# hijri_converter's English month names
+HIJRI_MONTHS = [
+    'Muharram', 'Safar', 'Rabi’ al-Awwal', 'Rabi’ al-Thani',
+    'Jumada al-Ula', 'Jumada al-Akhirah', 'Rajab', 'Sha’ban',
+    'Ramadhan', 'Shawwal', 'Dhu al-Qi’dah', 'Dhu al-Hijjah'
+]
+BANGLA_MONTHS = [
+    'বৈশাখ', 'জ্যৈষ্ঠ', 'আষাঢ়', 'শ্রাবণ',
+    'ভাদ্র', 'আশ্বিন', 'কার্তিক', 'অগ্রহায়ণ',
+    'পৌষ', 'মাঘ', 'ফাল্গুন', 'চৈত্র'
+]
+
+# Dates are packed into one 32-bit int: year << 9 | month << 5 | day
+def pack(year, month, day):
+    return year << 9 | month << 5 | day
+
+def unpack(value):
+    return value >> 9, value >> 5 & 15, value & 31
+
+def bengali_from_gregorian(gregorian_date):
+    """The clocks' Bengali date rule: the year turns on 14 April and months start on the 14th."""
+    # Calculate Bengali year (1429 = 2022-2023)
+    if (gregorian_date.month > 4) or (gregorian_date.month == 4 and gregorian_date.day >= 14):
+        bengali_year = gregorian_date.year - 593
+    else:
+        bengali_year = gregorian_date.year - 594
+
+    # Calculate Bengali month and day
+    month_offset = 3 if gregorian_date.day > 13 else 4
+    bengali_month = (gregorian_date.month - month_offset) % 12
+    if bengali_month == 0:
+        bengali_month = 12
+
+    bengali_day = gregorian_date.day - 13 if gregorian_date.day > 13 else (31 if gregorian_date.month-1 in [0,2,4,6,7,9,11] else 30) - (13 - gregorian_date.day)
+    return bengali_year, bengali_month, bengali_day
+
+BLOCK_BITS = 9 # Rows are filled in blocks of 512 days, on first use
+
+class CalendarTable:
+    """Hijri and Bengali dates for every supported Gregorian day, indexed by day number.
+
+    Rows come from the Umm al-Qura month starts (the same data hijri_converter
+    bisects on every call) and the clocks' Bengali rule. Each 512-day block
+    is filled the first time a date in it is asked for, so a clock only ever
+    builds the block around today. After that a conversion is one array index
+    and a few shifts. The *_array methods convert whole NumPy arrays of day
+    numbers at once.
+    """
+
+    def __init__(self):
+        days = LAST_ORDINAL - FIRST_ORDINAL + 1
+        self.hijri_days = array('I', bytes(4 * days))
+        self.bengali_days = array('I', bytes(4 * days))
+        self.built = bytearray((days >> BLOCK_BITS) + 1)
+        from hijri_converter import helpers, ummalqura
+        self.hijri_offset = ummalqura.HIJRI_OFFSET
+        self.month_starts = [helpers.jdn_to_ordinal(helpers.rjd_to_jdn(rjd)) for rjd in ummalqura.MONTH_STARTS]
+
+    def build_block(self, block):
+        first = FIRST_ORDINAL + (block << BLOCK_BITS)
+        last = min(first + (1 << BLOCK_BITS), LAST_ORDINAL + 1)
+
+        # Hijri: walk the months that overlap the block
+        starts = self.month_starts
+        index = bisect_right(starts, first) - 1
+        ordinal = first
+        while ordinal < last:
+            months = index + self.hijri_offset
+            year, month = months // 12 + 1, months % 12 + 1
+            end = min(starts[index + 1], last)
+            for o in range(ordinal, end):
+                self.hijri_days[o - FIRST_ORDINAL] = pack(year, month, o - starts[index] + 1)
+            ordinal = end
+            index += 1
+
+        day = date.fromordinal(first)
+        one_day = timedelta(days=1)
+        for o in range(first, last):
+            self.bengali_days[o - FIRST_ORDINAL] = pack(*bengali_from_gregorian(day))
+            day += one_day
+        self.built[block] = 1
+
+    def build_all(self):
+        for block in range(len(self.built)):
+            if not self.built[block]:
+                self.build_block(block)
+
+    def index(self, day):
+        """Table index of a date or day number (date.toordinal())."""
+        ordinal = day if isinstance(day, int) else day.toordinal()
+        if not FIRST_ORDINAL <= ordinal <= LAST_ORDINAL:
+            raise OverflowError("date out of range")
+        index = ordinal - FIRST_ORDINAL
+        if not self.built[index >> BLOCK_BITS]:
+            self.build_block(index >> BLOCK_BITS)
+        return index
+
+    def hijri(self, day):
+        """(year, month, day) in the Umm al-Qura calendar."""
+        return unpack(self.hijri_days[self.index(day)])
+
+    def bengali(self, day):
+        """(year, month, day) by the clocks' Bengali rule."""
+        return unpack(self.bengali_days[self.index(day)])
+
+    def hijri_month_length(self, year, month):
+        index = (year - 1) * 12 + month - 1 - self.hijri_offset
+        return self.month_starts[index + 1] - self.month_starts[index]
+
+    # --- Vectorized ---
+    def hijri_array(self, ordinals):
+        """(n, 3) array of Hijri year, month, day for an array of day numbers."""
+        return self.lookup_array(self.hijri_days, ordinals)
+
+    def bengali_array(self, ordinals):
+        """(n, 3) array of Bengali year, month, day for an array of day numbers."""
+        return self.lookup_array(self.bengali_days, ordinals)
+
+    def lookup_array(self, packed_days, ordinals):
+        import numpy as np
+
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        if ordinals.size and (ordinals.min() < FIRST_ORDINAL or ordinals.max() > LAST_ORDINAL):
+            raise OverflowError("date out of range")
+        indexes = ordinals - FIRST_ORDINAL
+        if not all(self.built):
+            for block in np.flatnonzero(np.bincount(indexes >> BLOCK_BITS, minlength=len(self.built))):
+                if not self.built[block]:
+                    self.build_block(block)
+        packed = np.frombuffer(packed_days, dtype=np.uint32)[indexes]
+        return np.stack([packed >> 9, packed >> 5 & 15, packed & 31], axis=-1).astype(np.int32)
+
+def ordinals_from_datetime64(dates):
+    """Day numbers (date.toordinal()) for an array of numpy datetime64 values."""
+    import numpy as np
+
+    return np.asarray(dates, dtype='datetime64[D]').astype(np.int64) + date(1970, 1, 1).toordinal()
+
+@lru_cache(maxsize=None)
+def get_table():
+    """The shared table, built on first use."""
+    return CalendarTable()
+
+def hijri_date(day):
+    return get_table().hijri(day)
+
+def bengali_date(day):
+    return get_table().bengali(day)
+
+# --- Benchmark ---
+def benchmark(lookups=100_000, batch=2_000_000, seed=0):
+    """Check the table against hijri_converter and time scalar and vectorized lookups."""
+    import random
+
+    import numpy as np
+    from hijri_converter import Gregorian, locales, ummalqura
+
+    assert (FIRST_DATE, LAST_DATE) == tuple(date(*day) for day in ummalqura.GREGORIAN_RANGE)
+    assert HIJRI_MONTHS == list(locales.get_locale("en").month_names)
+
+    start = time.perf_counter()
+    table = CalendarTable()
+    table.hijri(date.today())
+    first_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    table.build_all()
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    # Every supported day must match hijri_converter exactly
+    for ordinal in range(FIRST_ORDINAL, LAST_ORDINAL + 1):
+        day = date.fromordinal(ordinal)
+        assert table.hijri(ordinal) == Gregorian.fromdate(day).to_hijri().datetuple(), day
+        assert table.bengali(ordinal) == bengali_from_gregorian(day), day
+
+    rng = random.Random(seed)
+    days = [date.fromordinal(rng.randint(FIRST_ORDINAL, LAST_ORDINAL)) for _ in range(lookups)]
+    start = time.perf_counter()
+    for day in days:
+        Gregorian(day.year, day.month, day.day).to_hijri()
+    converter_us = (time.perf_counter() - start) / lookups * 1e6
+    start = time.perf_counter()
+    for day in days:
+        table.hijri(day)
+    table_us = (time.perf_counter() - start) / lookups * 1e6
+
+    ordinals = np.random.default_rng(seed).integers(FIRST_ORDINAL, LAST_ORDINAL + 1, batch)
+    start = time.perf_counter()
+    table.hijri_array(ordinals)
+    table.bengali_array(ordinals)
+    batch_s = time.perf_counter() - start
+
+    print(f"table: {LAST_ORDINAL - FIRST_ORDINAL + 1:,} days ({FIRST_DATE} to {LAST_DATE}), "
+          f"{2 * len(table.hijri_days) * 4 / 1024:.0f} KiB, matches hijri_converter")
+    print(f"first lookup {first_ms:.2f} ms (one block), whole table {build_ms:.0f} ms")
+    print(f"scalar Hijri: hijri_converter {converter_us:.2f} us, table {table_us:.2f} us "
+          f"({converter_us / table_us:.1f}x)")
+    print(f"vectorized: {batch:,} dates to Hijri and Bengali in {batch_s * 1e3:.0f} ms "
+          f"({batch / batch_s / 1e6:.1f}M dates/sec)")
+
+if __name__ == "__main__":
+    benchmark()
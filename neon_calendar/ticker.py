@@ -0,0 +1,187 @@
+import collections
+import math
+import time
+
+class Ticker:
+    """Runs a clock's periodic updates from one Tk after() callback, without drift.
+
+    Jobs are added with add(callback, period). Each job is due at the next
+    wall-clock multiple of its period: a 1 second job lands just after every
+    second boundary, and a 0.1 second glow frame every tenth of a second.
+    Deadlines are held on the monotonic clock, and the wall clock is re-read
+    on every wake, so a clock change or a slow callback never makes the
+    schedule creep. Every job that is due runs in the same wake. Then there
+    is a single after() until the earliest next deadline.
+
+    A wake that comes after a deadline adds to the jitter samples. A job that
+    falls a whole period behind counts as missed; missed periods are not
+    replayed.
+    """
+
+    def __init__(self, root, slack=0.002, samples=3600, clock=time.monotonic, wall=time.time):
+        self.root = root
+        self.slack = slack # Jobs due this soon run in the current wake
+        self.clock = clock
+        self.wall = wall
+        self.jobs = [] # [callback, period, deadline]
+        self.jitter = collections.deque(maxlen=samples) # Seconds late, per job run
+        self.wakes = 0
+        self.runs = 0
+        self.missed = 0
+        self.pending = None
+
+    def add(self, callback, period):
+        self.jobs.append([callback, period, None])
+
+    def start(self):
+        """Run every job now, then keep them on schedule."""
+        for job in self.jobs:
+            job[0]()
+        self.reschedule(self.clock())
+
+    def stop(self):
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+
+    def next_boundary(self, period, mono, wall):
+        """Monotonic time of the next wall-clock multiple of `period` after `wall`."""
+        return mono + (math.floor(wall / period) + 1) * period - wall
+
+    def reschedule(self, woke):
+        mono, wall = self.clock(), self.wall()
+        for job in self.jobs:
+            if job[2] is None or job[2] <= woke + self.slack:
+                job[2] = self.next_boundary(job[1], mono, wall)
+        delay = min(job[2] for job in self.jobs) - self.clock()
+        # Tk rounds to whole milliseconds; round up so we never wake early
+        self.pending = self.root.after(max(1, math.ceil(delay * 1000)), self.wake)
+
+    def wake(self):
+        self.wakes += 1
+        woke = self.clock()
+        for job in self.jobs:
+            callback, period, deadline = job
+            if deadline > woke + self.slack:
+                continue
+            late = max(0.0, woke - deadline)
+            self.jitter.append(late)
+            self.missed += int(late / period)
+            self.runs += 1
+            callback()
+        self.reschedule(woke)
+
+    # --- Statistics ---
+    def stats(self):
+        """Wakes, job runs, missed periods and p50/p99/max lateness in ms."""
+        late = sorted(self.jitter)
+        pick = lambda pct: late[round((len(late) - 1) * pct / 100)] * 1e3 if late else 0.0
+        return {
+            "wakes": self.wakes,
+            "runs": self.runs,
+            "missed": self.missed,
+            "jitter_p50_ms": pick(50),
+            "jitter_p99_ms": pick(99),
+            "jitter_max_ms": late[-1] * 1e3 if late else 0.0,
+        }
+
+# --- Benchmark ---
+class SimulatedRoot:
+    """Stand-in for a Tk root on a simulated clock.
+
+    after() callbacks fire a little late, like a busy event loop, and each
+    callback takes `cost` seconds of simulated time.
+    """
+
+    def __init__(self, seed=0, latency=0.002, cost=0.003, start=1_700_000_000.25):
+        import random
+        self.rng = random.Random(seed)
+        self.latency = latency
+        self.cost = cost
+        self.now = start
+        self.queue = []
+
+    def clock(self):
+        return self.now
+
+    def after(self, ms, callback):
+        self.queue.append((self.now + ms / 1000 + self.rng.uniform(0, self.latency), callback))
+        return len(self.queue)
+
+    def after_cancel(self, ident):
+        pass
+
+    def run(self, until):
+        while self.queue and self.now < until:
+            self.queue.sort(key=lambda item: item[0])
+            self.now, callback = self.queue.pop(0)
+            callback()
+
+def simulate(seconds, fixed_ms=None, period=1.0):
+    """Seconds shown on a clock over `seconds` of simulated time.
+
+    With fixed_ms the update reschedules itself with after(fixed_ms) like the
+    old clocks did; otherwise it runs from a Ticker with the given period.
+    Returns (wakes, seconds skipped, seconds repeated, mean ms after the boundary).
+    """
+    root = SimulatedRoot()
+    shown = []
+    start = root.now
+
+    def update():
+        shown.append((root.now, math.floor(root.now)))
+        root.now += root.rng.uniform(0, root.cost)
+        if fixed_ms:
+            root.after(fixed_ms, update)
+
+    if fixed_ms:
+        update()
+    else:
+        ticker = Ticker(root, clock=root.clock, wall=root.clock)
+        ticker.add(update, period)
+        ticker.start()
+    root.run(start + seconds)
+
+    changes = [(at, second) for (at, second), (_, before) in zip(shown[1:], shown) if second != before]
+    skipped = sum(second - before - 1 for (_, second), (_, before) in zip(changes[1:], changes))
+    repeated = len(shown) - 1 - len(changes) # Wakes that showed the same second again
+    lag = sum(at - second for at, second in changes) / len(changes) * 1e3
+    return len(shown), skipped, repeated, lag
+
+def benchmark(hours=1.0, realtime_seconds=3.0):
+    seconds = hours * 3600
+    print(f"simulated {hours:g} h, callbacks late by up to 2 ms and taking up to 3 ms:")
+    for name, fixed_ms, period in (("after(1000)", 1000, 1.0), ("Ticker 1 s", None, 1.0),
+                                   ("after(100)", 100, 1.0), ("Ticker 0.1 s", None, 0.1)):
+        wakes, skipped, repeated, lag = simulate(seconds, fixed_ms, period)
+        # A 10 Hz clock repeats every second by design, so repeats only matter at 1 Hz
+        repeats = f"{repeated} repeated" if wakes < seconds * 2 else "-"
+        print(f"{name:>13}: {wakes / hours:>6,.0f} wakes/h, {skipped} seconds skipped, "
+              f"{repeats}, new second shown {lag:.1f} ms after the boundary on average")
+
+    # The real clocks on this machine, sleeping between wakes instead of a Tk loop
+    class SleepRoot:
+        def __init__(self):
+            self.queue = []
+        def after(self, ms, callback):
+            self.queue.append((time.monotonic() + ms / 1000, callback))
+        def after_cancel(self, ident):
+            pass
+
+    root = SleepRoot()
+    ticker = Ticker(root)
+    ticker.add(lambda: None, 1.0)
+    ticker.add(lambda: None, 0.1)
+    ticker.start()
+    end = time.monotonic() + realtime_seconds
+    while time.monotonic() < end:
+        due, callback = root.queue.pop()
+        time.sleep(max(0.0, due - time.monotonic()))
+        callback()
+    stats = ticker.stats()
+    print(f"real {realtime_seconds:g} s at 1 s + 0.1 s: {stats['wakes']} wakes, {stats['runs']} runs, "
+          f"{stats['missed']} missed, late p50 {stats['jitter_p50_ms']:.2f} ms, "
+          f"p99 {stats['jitter_p99_ms']:.2f} ms, max {stats['jitter_max_ms']:.2f} ms")
+
+if __name__ == "__main__":
+    benchmark()
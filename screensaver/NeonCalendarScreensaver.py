@@ -1,12 +1,19 @@
 import tkinter as tk
 from tkinter import font as tkfont
-from datetime import datetime, timedelta
-import hijri_converter
-import pytz
+from datetime import datetime
 import sys
 import os
 import json
 
+# The shared calendar package lives one level up, next to the clocks.
+# Importing it is cheap; hijri_converter only loads when the first date is shown.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from neon_calendar import (SUNSET_HOUR, SUNRISE_HOUR, HIJRI_OFFSET, DHAKA, LabelSchedule, at_hours, at_sun,
+                           Ticker, Glow, Sun, get_timezone, english_time, bangla_time, gregorian_label,
+                           hijri_label, bengali_label)
+
+GLOW_FRAME = 0.1  # Seconds between glow steps
+
 class NeonCalendarScreensaver:
     def __init__(self, root, is_screensaver=True):
         self.root = root
@@ -24,12 +31,8 @@ class NeonCalendarScreensaver:
             self.root.geometry("1000x800")
         
         # Timezone setup
-        self.local_tz = pytz.timezone(self.config.get('timezone', 'Asia/Dhaka'))
-        
-        # Initialize glow effect
-        self.glow_phase = 0
-        self.glow_direction = 1
-        self.glow_speed = 0.05
+        self.local_tz = get_timezone(self.config.get('timezone', 'Asia/Dhaka'))
+        self.sun = self.get_sun()
         
         # Color scheme
         self.colors = {
@@ -41,25 +44,44 @@ class NeonCalendarScreensaver:
             'border': '#444444'   # Border
         }
         
-        # Font setup
+        # Glow effect: labels register by colour role as they are created
+        self.glow = Glow(self.colors, ['time', 'bangla', 'hijri', 'bengali', 'title'],
+                         self.config.get('glow_speed', 0.05))
+        
+        # Font setup: plain tuples, Tk resolves them as the labels are drawn
         self.fonts = {
-            'time': self.get_font("Arial", 100, "bold"),
-            'date': self.get_font("Arial", 50),
-            'bangla': self.get_font("SolaimanLipi", 50, fallback="Vrinda"),
-            'title': self.get_font("Arial", 30, "bold")
+            'time': ("Arial", 100, "bold"),
+            'date': ("Arial", 50),
+            'bangla': ("SolaimanLipi", 50),
+            'title': ("Arial", 30, "bold")
         }
         
         # Main UI setup
         self.setup_ui()
-        self.update_clock()
+        self.setup_label_schedule()
+        
+        # Fast start: paint the time now, load the calendars once it's on screen
+        self.show_time(self.get_local_time())
+        self.root.update_idletasks()
+        self.root.after_idle(self.finish_startup)
 
-    def get_font(self, family, size, weight="normal", fallback=None):
-        try:
-            return tkfont.Font(family=family, size=size, weight=weight)
-        except:
-            if fallback:
-                return tkfont.Font(family=fallback, size=size, weight=weight)
-            return tkfont.Font(family="Arial", size=size, weight=weight)
+    def finish_startup(self):
+        self.pick_bangla_font()
+        
+        # One drift-free callback: glow frames every GLOW_FRAME, labels on each new second
+        self.ticker = Ticker(self.root)
+        self.ticker.add(self.update_glow_effect, GLOW_FRAME)
+        self.ticker.add(self.update_clock, 1)
+        self.ticker.start()
+
+    def pick_bangla_font(self, fallbacks=("SolaimanLipi", "Vrinda")):
+        # Listing the installed fonts is slow, so it waits until after the first frame
+        families = set(tkfont.families(self.root))
+        family = next((f for f in fallbacks if f in families), None)
+        if family and family != self.fonts['bangla'][0]:
+            self.fonts['bangla'] = (family, 50)
+            self.bangla_time.config(font=self.fonts['bangla'])
+            self.bengali_date.config(font=self.fonts['bangla'])
 
     def setup_ui(self):
         self.main_frame = tk.Frame(self.root, bg='black')
@@ -75,13 +97,15 @@ class NeonCalendarScreensaver:
         time_frame = tk.Frame(self.main_frame, bg='black')
         time_frame.pack(pady=(40, 30))
         
-        tk.Label(
+        title = tk.Label(
             time_frame,
             text="LOCAL TIME",
             font=self.fonts['title'],
             fg=self.colors['title'],
             bg='black'
-        ).pack()
+        )
+        title.pack()
+        self.glow.register('title', title)
         
         self.english_time = tk.Label(
             time_frame,
@@ -90,6 +114,7 @@ class NeonCalendarScreensaver:
             bg='black'
         )
         self.english_time.pack(pady=(10, 0))
+        self.glow.register('time', self.english_time)
         
         self.bangla_time = tk.Label(
             time_frame,
@@ -98,6 +123,7 @@ class NeonCalendarScreensaver:
             bg='black'
         )
         self.bangla_time.pack(pady=(20, 0))
+        self.glow.register('bangla', self.bangla_time)
 
     def setup_calendar_display(self):
         calendar_frame = tk.Frame(self.main_frame, bg='black', padx=40, pady=20)
@@ -107,7 +133,7 @@ class NeonCalendarScreensaver:
         self.add_calendar_section(
             calendar_frame,
             "GREGORIAN DATE",
-            self.colors['title'],
+            'title',
             'white',
             self.fonts['date']
         )
@@ -116,8 +142,8 @@ class NeonCalendarScreensaver:
         self.add_calendar_section(
             calendar_frame,
             "HIJRI DATE",
-            self.colors['hijri'],
-            self.colors['hijri'],
+            'hijri',
+            'hijri',
             self.fonts['date']
         )
         
@@ -125,30 +151,34 @@ class NeonCalendarScreensaver:
         self.add_calendar_section(
             calendar_frame,
             "BENGALI DATE",
-            self.colors['bengali'],
-            self.colors['bengali'],
+            'bengali',
+            'bengali',
             self.fonts['bangla']
         )
 
     def add_calendar_section(self, parent, title, title_color, text_color, font):
+        # Colours are either a role in self.colors (those glow) or a plain colour
         frame = tk.Frame(parent, bg='black', bd=2, relief=tk.RIDGE)
         frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(
+        title_label = tk.Label(
             frame,
             text=title,
             font=self.fonts['title'],
-            fg=title_color,
+            fg=self.colors.get(title_color, title_color),
             bg='black'
-        ).pack()
+        )
+        title_label.pack()
+        self.glow.register(title_color, title_label)
         
         label = tk.Label(
             frame,
             font=font,
-            fg=text_color,
+            fg=self.colors.get(text_color, text_color),
             bg='black'
         )
         label.pack(pady=(5, 10))
+        self.glow.register(text_color, label)
         
         # Store reference to the label
         if "GREGORIAN" in title:
@@ -163,6 +193,8 @@ class NeonCalendarScreensaver:
         default_config = {
             'timezone': 'Asia/Dhaka',
             'hijri_offset': -1,  # Show 1 day less
+            'latitude': DHAKA[0],  # Where sunrise and sunset are worked out for
+            'longitude': DHAKA[1],
             'glow_speed': 0.05
         }
         
@@ -182,138 +214,55 @@ class NeonCalendarScreensaver:
             self.root.destroy()
             sys.exit()
 
-    def to_bangla_digits(self, number):
-        bangla_digits = {
-            '0': '০', '1': '১', '2': '২', '3': '৩', '4': '৪',
-            '5': '৫', '6': '৬', '7': '৭', '8': '৮', '9': '৯'
-        }
-        return ''.join([bangla_digits.get(d, d) for d in str(number)])
-
     def get_local_time(self):
         return datetime.now(self.local_tz)
 
-    def get_hijri_date(self):
-        now = self.get_local_time()
-        sunset_hour = 18  # 6 PM as approximation
-        
-        gregorian_date = now.date()
-        hijri = hijri_converter.Gregorian(
-            gregorian_date.year,
-            gregorian_date.month,
-            gregorian_date.day
-        ).to_hijri()
-        
-        # Apply offset (show 1 day less)
-        hijri_day = hijri.day + self.config.get('hijri_offset', -1)
-        hijri_month = hijri.month
-        hijri_year = hijri.year
-        
-        # Handle day underflow
-        if hijri_day < 1:
-            hijri_month -= 1
-            if hijri_month < 1:
-                hijri_month = 12
-                hijri_year -= 1
-            prev_month = hijri_converter.Hijri(hijri_year, hijri_month, 1)
-            hijri_day = prev_month.month_length()
-        
-        # Handle sunset transition
-        if now.hour >= sunset_hour:
-            tomorrow = (now + timedelta(days=1)).date()
-            hijri_tomorrow = hijri_converter.Gregorian(
-                tomorrow.year,
-                tomorrow.month,
-                tomorrow.day
-            ).to_hijri()
-            
-            hijri_tomorrow_day = hijri_tomorrow.day + self.config.get('hijri_offset', -1)
-            hijri_tomorrow_month = hijri_tomorrow.month
-            hijri_tomorrow_year = hijri_tomorrow.year
-            
-            if hijri_tomorrow_day < 1:
-                hijri_tomorrow_month -= 1
-                if hijri_tomorrow_month < 1:
-                    hijri_tomorrow_month = 12
-                    hijri_tomorrow_year -= 1
-                prev_month = hijri_converter.Hijri(hijri_tomorrow_year, hijri_tomorrow_month, 1)
-                hijri_tomorrow_day = prev_month.month_length()
-            
-            if hijri.day != hijri_tomorrow.day or hijri.month != hijri_tomorrow.month:
-                hijri_tomorrow = hijri_converter.Hijri(hijri_tomorrow_year, hijri_tomorrow_month, hijri_tomorrow_day)
-                return f"{hijri_tomorrow_day} {hijri_tomorrow.month_name()}, {hijri_tomorrow_year} AH"
-        
-        hijri = hijri_converter.Hijri(hijri_year, hijri_month, hijri_day)
-        return f"{hijri_day} {hijri.month_name()}, {hijri_year} AH"
+    def get_sun(self):
+        return Sun(self.local_tz, self.config.get('latitude', DHAKA[0]), self.config.get('longitude', DHAKA[1]))
 
-    def get_bengali_date(self):
-        now = self.get_local_time()
-        sunrise_hour = 6
-        
-        if now.hour >= sunrise_hour:
-            gregorian_date = now.date()
-        else:
-            gregorian_date = (now - timedelta(days=1)).date()
-        
-        bangla_months = [
-            'বৈশাখ', 'জ্যৈষ্ঠ', 'আষাঢ়', 'শ্রাবণ',
-            'ভাদ্র', 'আশ্বিন', 'কার্তিক', 'অগ্রহায়ণ',
-            'পৌষ', 'মাঘ', 'ফাল্গুন', 'চৈত্র'
-        ]
-        
-        if (gregorian_date.month > 4) or (gregorian_date.month == 4 and gregorian_date.day >= 14):
-            bengali_year = gregorian_date.year - 593
-        else:
-            bengali_year = gregorian_date.year - 594
-            
-        month_offset = 3 if gregorian_date.day > 13 else 4
-        bengali_month = (gregorian_date.month - month_offset) % 12
-        if bengali_month == 0:
-            bengali_month = 12
-            
-        bengali_day = gregorian_date.day - 13 if gregorian_date.day > 13 else (31 if gregorian_date.month-1 in [0,2,4,6,7,9,11] else 30) - (13 - gregorian_date.day)
-        
-        return f"{self.to_bangla_digits(bengali_day)} {bangla_months[bengali_month-1]}, {self.to_bangla_digits(bengali_year)}"
+    def get_hijri_date(self, now=None):
+        return hijri_label(now or self.get_local_time(), self.config.get('hijri_offset', HIJRI_OFFSET),
+                           SUNSET_HOUR, self.sun)
+
+    def get_bengali_date(self, now=None):
+        return bengali_label(now or self.get_local_time(), SUNRISE_HOUR, self.sun)
 
     def update_glow_effect(self):
-        self.glow_phase += self.glow_speed * self.glow_direction
-        if self.glow_phase >= 1:
-            self.glow_direction = -1
-        elif self.glow_phase <= 0:
-            self.glow_direction = 1
+        self.glow.tick()
+
+    def setup_label_schedule(self):
+        # Date labels are only recomputed when they can change: midnight, sunset, sunrise
+        self.shown_second = None
+        self.date_labels = LabelSchedule()
+        self.date_labels.add(
+            lambda text: self.gregorian_date.config(text=text),
+            gregorian_label,
+            at_hours(0))
+        self.date_labels.add(
+            lambda text: self.hijri_date.config(text=text),
+            self.get_hijri_date,
+            at_sun(self.sun, 'sunset', SUNSET_HOUR))
+        self.date_labels.add(
+            lambda text: self.bengali_date.config(text=text),
+            self.get_bengali_date,
+            at_sun(self.sun, 'sunrise', SUNRISE_HOUR))
+
+    def show_time(self, local_time):
+        # Time displays only change when the shown second does
+        second = local_time.replace(microsecond=0)
+        if second != self.shown_second:
+            self.shown_second = second
+            self.english_time.config(text=english_time(local_time))
+            self.bangla_time.config(text=bangla_time(local_time))
+
+    def update_labels(self, local_time):
+        self.show_time(local_time)
         
-        for color_name in ['time', 'bangla', 'hijri', 'bengali', 'title']:
-            base_color = self.colors[color_name]
-            r, g, b = [int(base_color[i:i+2], 16) for i in (1, 3, 5)]
-            r = min(255, int(r * (0.8 + 0.2 * self.glow_phase)))
-            g = min(255, int(g * (0.8 + 0.2 * self.glow_phase)))
-            b = min(255, int(b * (0.8 + 0.2 * self.glow_phase)))
-            glow_color = f"#{r:02x}{g:02x}{b:02x}"
-            
-            # Update all labels with this color
-            for widget in self.main_frame.winfo_children():
-                if isinstance(widget, tk.Label) and widget.cget('fg') == base_color:
-                    widget.config(fg=glow_color)
+        # Calendar displays
+        self.date_labels.update(local_time)
 
     def update_clock(self):
-        local_time = self.get_local_time()
-        
-        self.update_glow_effect()
-        
-        # Update time displays
-        self.english_time.config(text=local_time.strftime("%I:%M:%S %p"))
-        
-        hour = self.to_bangla_digits(local_time.strftime("%I"))
-        minute = self.to_bangla_digits(local_time.strftime("%M"))
-        second = self.to_bangla_digits(local_time.strftime("%S"))
-        ampm = "PM" if local_time.strftime("%p") == "PM" else "AM"
-        self.bangla_time.config(text=f"{hour}:{minute}:{second} {ampm}")
-        
-        # Update calendar displays
-        self.gregorian_date.config(text=local_time.strftime("%A, %B %d, %Y"))
-        self.hijri_date.config(text=self.get_hijri_date())
-        self.bengali_date.config(text=self.get_bengali_date())
-        
-        self.root.after(100, self.update_clock)
+        self.update_labels(self.get_local_time())
 
 def show_config_dialog():
     root = tk.Tk()
@@ -3,14 +3,14 @@
 
 a = Analysis(
     ['NeonCalendarScreensaver.py'],
-    pathex=[],
+    pathex=['..'],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['tzdata'],  # zoneinfo reads it at run time; Windows has no tz database
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['numpy', 'pytz'],  # Only the neon_calendar benchmarks and the pytz fallback use these
     noarchive=False,
     optimize=0,
 )
@@ -0,0 +1,153 @@
+import time
+STARTED = time.perf_counter()  # Startup is timed from here: import -> first paint
+
+import tkinter as tk
+from NeonCalendarScreensaver import NeonCalendarScreensaver
+IMPORTED = time.perf_counter()
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from neon_calendar import get_timezone, english_time, bangla_time, gregorian_label
+
+# Benchmarks for the screensaver, kept out of the shipped script.
+#   python bench_screensaver.py updates   label updates per hour, no window
+#   python bench_screensaver.py startup   cold start, before vs now
+
+LABELS = ['english_time', 'bangla_time', 'gregorian_date', 'hijri_date', 'bengali_date']
+
+class CountingLabel:
+    """Stand-in for a tk.Label that counts config() calls."""
+    def __init__(self):
+        self.calls = 0
+        self.text = None
+
+    def config(self, text=None, **kwargs):
+        self.calls += 1
+        if text is not None:
+            self.text = text
+
+def benchmark_updates(hours=1.0, start_hour=17.5):
+    """CPU seconds per hour spent on label text at 100 ms ticks: every tick vs on change only.
+
+    Runs without a window, on simulated time that crosses sunset. The labels
+    are stand-ins, so this only counts the Python side; every skipped
+    config() call also saves Tk a redraw.
+    """
+    app = NeonCalendarScreensaver.__new__(NeonCalendarScreensaver)
+    app.config = {}
+    app.local_tz = get_timezone('Asia/Dhaka')
+    app.sun = app.get_sun()
+    start = datetime(2025, 3, 1, tzinfo=app.local_tz) + timedelta(hours=start_hour)
+    times = [start + timedelta(milliseconds=100 * i) for i in range(int(hours * 36000))]
+
+    results = {}
+    for mode in ("every tick", "on change"):
+        for name in LABELS:
+            setattr(app, name, CountingLabel())
+        app.setup_label_schedule()
+        started = time.process_time()
+        for now in times:
+            if mode == "on change":
+                app.update_labels(now)
+                continue
+            # What update_clock used to do on every tick
+            app.english_time.config(text=english_time(now))
+            app.bangla_time.config(text=bangla_time(now))
+            app.gregorian_date.config(text=gregorian_label(now))
+            app.hijri_date.config(text=app.get_hijri_date(now))
+            app.bengali_date.config(text=app.get_bengali_date(now))
+        cpu_per_hour = (time.process_time() - started) / hours
+        calls = sum(getattr(app, name).calls for name in LABELS) / hours
+        results[mode] = ([getattr(app, name).text for name in LABELS], cpu_per_hour)
+        print(f"{mode:>10}: {cpu_per_hour:.2f} CPU s/hour, {calls:,.0f} label updates/hour")
+
+    assert results["every tick"][0] == results["on change"][0], "labels differ"
+    print(f"{results['every tick'][1] / results['on change'][1]:.1f}x less CPU for the label text")
+    return results
+
+# --- Startup ---
+def startup_probe(old=False):
+    """One cold start: prints ms from the top of this file to each startup phase as JSON.
+
+    With old=True it does what the screensaver did before the fast start:
+    hijri_converter (and pytz, where installed) imported and the dates worked
+    out before the first frame.
+    """
+    imported = IMPORTED
+    if old:
+        import hijri_converter
+        try:
+            import pytz
+        except ImportError:
+            pass
+        imported = time.perf_counter()
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        root = None
+    if root:
+        app = NeonCalendarScreensaver(root, is_screensaver=False)
+        if old:
+            # Dates were worked out before anything was shown
+            app.finish_startup()
+        first_paint = time.perf_counter()
+        while not hasattr(app, 'ticker'):
+            root.update()
+        ready = time.perf_counter()
+        root.destroy()
+    else:
+        # No display: the same startup work on stand-in labels
+        app = NeonCalendarScreensaver.__new__(NeonCalendarScreensaver)
+        app.config = app.load_config()
+        app.local_tz = get_timezone(app.config.get('timezone', 'Asia/Dhaka'))
+        app.sun = app.get_sun()
+        for name in LABELS:
+            setattr(app, name, CountingLabel())
+        app.setup_label_schedule()
+        now = app.get_local_time()
+        if old:
+            app.date_labels.update(now)
+        app.show_time(now)
+        first_paint = time.perf_counter()
+        app.date_labels.update(now)
+        ready = time.perf_counter()
+    phases = {"imports": imported, "first paint": first_paint, "calendars ready": ready}
+    print(json.dumps({"window": root is not None, **{k: (v - STARTED) * 1e3 for k, v in phases.items()}}))
+
+def benchmark_startup(runs=9):
+    """Median cold start over fresh interpreters, fast start vs everything up front."""
+    import statistics
+    import subprocess
+
+    probes = {'--probe': [], '--probe-old': []}
+    for _ in range(runs):
+        # Interleaved, so a busy machine slows both the same
+        for arg, results in probes.items():
+            out = subprocess.run([sys.executable, '-W', 'ignore', os.path.abspath(__file__), arg],
+                                 capture_output=True, text=True, check=True)
+            results.append(json.loads(out.stdout.splitlines()[-1]))
+    where = "real window" if probes['--probe'][0]['window'] else "no display, stand-in labels"
+    print(f"cold start, median of {runs} ({where}), ms from the top of the script:")
+    print(f"{'':>16}  {'before':>6}  {'now':>6}")
+    for phase in ("imports", "first paint", "calendars ready"):
+        before, now = (statistics.median(p[phase] for p in probes[arg]) for arg in ('--probe-old', '--probe'))
+        print(f"{phase:>16}: {before:6.1f}  {now:6.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Neon Calendar screensaver benchmarks")
+    parser.add_argument("bench", nargs="?", choices=["updates", "startup"], default="updates",
+                        help="label updates per hour (default) or cold start time")
+    parser.add_argument("--runs", type=int, default=9, help="fresh interpreters per startup variant")
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--probe-old", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe or args.probe_old:
+        startup_probe(old=args.probe_old)
+    elif args.bench == "startup":
+        benchmark_startup(args.runs)
+    else:
+        benchmark_updates()
@@ -1,14 +1,17 @@
+import argparse
+import cProfile
 import pygame
-import random
-import collections
 import datetime # Import the datetime module
+import time
+
+from snake_engine import GRID_WIDTH, GRID_HEIGHT, SnakeGame, run_headless
+from snake_ai import AI_FACTORIES
+from snake_profile import PhaseTimer
 
 # --- Game Constants ---
-SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 400
 GRID_SIZE = 20
-GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
-GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
+SCREEN_WIDTH = GRID_WIDTH * GRID_SIZE
+SCREEN_HEIGHT = GRID_HEIGHT * GRID_SIZE
 
 # Colors
 WHITE = (255, 255, 255)
@@ -17,152 +20,148 @@ RED = (255, 0, 0)
 BLACK = (0, 0, 0)
 BLUE = (0, 0, 255) # For AI path visualization (optional)
 
-# Directions
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
-
-# --- Snake Class ---
-class Snake:
-    def __init__(self):
-        # Initial position in the middle of the screen
-        self.body = collections.deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])
-        self.direction = random.choice([UP, DOWN, LEFT, RIGHT])
-        self.score = 0
-        self.grow_pending = False # Flag to indicate if snake should grow
-
-    def move(self):
-        # Calculate new head position
-        head_x, head_y = self.body[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
-        self.body.appendleft(new_head) # Add new head
-
-        if not self.grow_pending:
-            self.body.pop() # Remove tail if not growing
+# --- Drawing ---
+def draw_snake(screen, snake):
+    for segment in snake.body:
+        pygame.draw.rect(screen, GREEN, (segment[0] * GRID_SIZE, segment[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+def draw_food(screen, food):
+    pygame.draw.rect(screen, RED, (food.position[0] * GRID_SIZE, food.position[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+def draw_full_frame(screen, font, snake, food):
+    """Redraw the whole screen every frame (the original renderer)."""
+    screen.fill(BLACK) # Clear screen
+
+    draw_snake(screen, snake)
+    draw_food(screen, food)
+
+    # Display score
+    score_text = font.render(f"Score: {snake.score}", True, WHITE)
+    screen.blit(score_text, (10, 10))
+
+    pygame.display.flip() # Update display
+
+# --- Incremental Rendering ---
+class IncrementalRenderer:
+    """Redraws only the cells that changed since the last frame.
+
+    Each tick only the new head, the old tail and the food can change, so
+    those cells are repainted from the snake's occupancy grid and pushed with
+    display.update(rects). The score surface is rendered once per score.
+    """
+
+    def __init__(self, screen, font):
+        self.screen = screen
+        self.font = font
+        self.score = None
+        self.score_surface = None
+        self.score_rect = None
+        self.prev_tail = None
+        self.prev_food = None
+
+    def cell_rect(self, cell):
+        return pygame.Rect(cell[0] * GRID_SIZE, cell[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+
+    def draw_cell(self, snake, food, cell):
+        if cell == food.position:
+            color = RED
+        elif snake.in_bounds(cell) and snake.occupied[cell[1] * snake.width + cell[0]]:
+            color = GREEN
         else:
-            self.grow_pending = False # Reset grow flag
-
-    def change_direction(self, new_direction):
-        # Prevent immediate 180-degree turns
-        if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
-            self.direction = new_direction
-
-    def grow(self):
-        self.grow_pending = True
-        self.score += 1
-
-    def check_collision(self):
-        head_x, head_y = self.body[0]
-
-        # Wall collision
-        if not (0 <= head_x < GRID_WIDTH and 0 <= head_y < GRID_HEIGHT):
-            return True
-
-        # Self-collision (check if head collides with any part of the body except itself)
-        if len(self.body) > 1 and self.body[0] in list(self.body)[1:]:
-            return True
-
-        return False
-
-    def draw(self, screen):
-        for segment in self.body:
-            pygame.draw.rect(screen, GREEN, (segment[0] * GRID_SIZE, segment[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-# --- Food Class ---
-class Food:
-    def __init__(self, snake_body):
-        self.position = self.generate_position(snake_body)
-
-    def generate_position(self, snake_body):
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in snake_body: # Ensure food doesn't spawn on snake
-                return (x, y)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, RED, (self.position[0] * GRID_SIZE, self.position[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-# --- AI Logic (Simple Greedy Pathfinding) ---
-def get_safe_direction(snake, food):
-    # Get current head position
-    head_x, head_y = snake.body[0]
-
-    # Possible directions
-    possible_directions = [UP, DOWN, LEFT, RIGHT]
-    random.shuffle(possible_directions) # Shuffle to add some randomness if multiple paths are equally good
-
-    best_direction = snake.direction # Default to current direction if no better path found
-
-    # Calculate distance to food for each possible move
-    min_distance = float('inf')
-
-    for dx, dy in possible_directions:
-        next_x, next_y = head_x + dx, head_y + dy
-        next_pos = (next_x, next_y)
-
-        # Check for immediate collision with walls or self
-        if not (0 <= next_x < GRID_WIDTH and 0 <= next_y < GRID_HEIGHT):
-            continue # Skip if it leads to wall collision
-
-        # Temporarily add the new head and check for self-collision
-        # Create a temporary body to simulate the move
-        temp_body = collections.deque(list(snake.body))
-        temp_body.appendleft(next_pos)
-        if not snake.grow_pending: # Simulate popping the tail if not growing
-            temp_body.pop()
-
-        if next_pos in list(temp_body)[1:]: # Check if the new head collides with the *simulated* body
-            continue # Skip if it leads to self-collision
-
-        # If it's a safe move, calculate distance to food
-        distance = abs(food.position[0] - next_x) + abs(food.position[1] - next_y)
-
-        # Prioritize moves that get closer to food
-        if distance < min_distance:
-            min_distance = distance
-            best_direction = (dx, dy)
-        elif distance == min_distance:
-            # If distances are equal, prefer continuing in the same general direction
-            # This helps prevent unnecessary zig-zagging
-            if (dx, dy) == snake.direction:
-                best_direction = (dx, dy)
-
-    # If no safe path to food, try to find any safe path to survive
-    if best_direction == snake.direction: # Means no better path was found based on food distance
-        for dx, dy in possible_directions:
-            next_x, next_y = head_x + dx, head_y + dy
-            next_pos = (next_x, next_y)
-
-            if not (0 <= next_x < GRID_WIDTH and 0 <= next_y < GRID_HEIGHT):
-                continue
-
-            temp_body = collections.deque(list(snake.body))
-            temp_body.appendleft(next_pos)
-            if not snake.grow_pending:
-                temp_body.pop()
-
-            if next_pos in list(temp_body)[1:]:
-                continue
-
-            return (dx, dy) # Return the first safe direction found
+            color = BLACK
+        rect = self.cell_rect(cell)
+        self.screen.fill(color, rect)
+        return rect
+
+    def draw_score(self, snake, food, area):
+        """Repaint the cells under the score area, then the score on top."""
+        self.screen.fill(BLACK, area)
+        for x in range(area.left // GRID_SIZE, (area.right - 1) // GRID_SIZE + 1):
+            for y in range(area.top // GRID_SIZE, (area.bottom - 1) // GRID_SIZE + 1):
+                if snake.in_bounds((x, y)):
+                    self.draw_cell(snake, food, (x, y))
+        self.screen.blit(self.score_surface, self.score_rect)
+
+    def draw(self, snake, food):
+        if self.score_surface is None:
+            # First frame: paint everything once
+            self.render_score(snake.score)
+            draw_snake(self.screen, snake)
+            draw_food(self.screen, food)
+            self.screen.blit(self.score_surface, self.score_rect)
+            pygame.display.flip()
+        else:
+            dirty = []
+            for cell in {snake.body[0], self.prev_tail, self.prev_food, food.position}:
+                if snake.in_bounds(cell):
+                    dirty.append(self.draw_cell(snake, food, cell))
+
+            # The score is drawn over the board, so repaint it if anything under it changed
+            old_rect = self.score_rect
+            score_changed = snake.score != self.score
+            if score_changed:
+                self.render_score(snake.score)
+            if score_changed or self.score_rect.collidelist(dirty) != -1:
+                area = old_rect.union(self.score_rect)
+                self.draw_score(snake, food, area)
+                dirty.append(area)
+
+            pygame.display.update(dirty)
+
+        self.prev_tail = snake.body[-1]
+        self.prev_food = food.position
+
+    def render_score(self, score):
+        self.score = score
+        self.score_surface = self.font.render(f"Score: {score}", True, WHITE)
+        self.score_rect = self.score_surface.get_rect(topleft=(10, 10))
+
+def benchmark_rendering(frames=2000, ai="hamiltonian", seed=0):
+    """Mean frame time of full redraws vs the incremental renderer, uncapped FPS."""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+
+    results = {}
+    for name in ("full", "incremental"):
+        game = SnakeGame(seed, policy=AI_FACTORIES[ai](GRID_WIDTH, GRID_HEIGHT))
+        screen.fill(BLACK)
+        renderer = IncrementalRenderer(screen, font)
+        draw_seconds = 0.0
+        for _ in range(frames):
+            pygame.event.pump()
+            if game.game_over:
+                game = SnakeGame(game.seed + 1, policy=AI_FACTORIES[ai](GRID_WIDTH, GRID_HEIGHT))
+                screen.fill(BLACK)
+                renderer = IncrementalRenderer(screen, font)
+            game.step()
+            start = time.perf_counter()
+            if name == "full":
+                draw_full_frame(screen, font, game.snake, game.food)
+            else:
+                renderer.draw(game.snake, game.food)
+            draw_seconds += time.perf_counter() - start
+        results[name] = draw_seconds / frames
+        print(f"{name:<12} {results[name] * 1e6:8.1f} us/frame  ({1 / results[name]:,.0f} FPS max), "
+              f"final length {len(game.snake.body)}")
 
-    return best_direction
+    pygame.quit()
+    print(f"Speed-up: {results['full'] / results['incremental']:.1f}x")
+    return results
 
 # --- Main Game Function ---
-def main():
+def main(ai="greedy", game_speed=10, timer=None, report_every=100):
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Self-Playing Snake")
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, 36) # Default font, size 36
+    renderer = IncrementalRenderer(screen, font)
 
-    snake = Snake()
-    food = Food(snake.body)
+    game = SnakeGame(policy=AI_FACTORIES[ai](GRID_WIDTH, GRID_HEIGHT), timer=timer)
+    snake = game.snake
 
     game_over = False
-    game_speed = 10 # Frames per second
     game_end_time = None # Variable to store the time when the game ends
 
     while not game_over:
@@ -170,37 +169,25 @@ def main():
             if event.type == pygame.QUIT:
                 game_over = True
 
-        # AI decides the next move
-        new_direction = get_safe_direction(snake, food)
-        snake.change_direction(new_direction)
-
-        snake.move()
+        # AI decides the next move, the engine moves, eats and checks collisions
+        game.step()
 
-        # Check for eating food
-        if snake.body[0] == food.position:
-            snake.grow()
-            food = Food(snake.body) # Generate new food
-
-        # Check for collision after moving
-        if snake.check_collision():
+        if game.game_over:
             game_over = True
             game_end_time = datetime.datetime.now() # Capture the current time when game ends
 
         # --- Drawing ---
-        screen.fill(BLACK) # Clear screen
-
-        snake.draw(screen)
-        food.draw(screen)
-
-        # Display score
-        score_text = font.render(f"Score: {snake.score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-
-        pygame.display.flip() # Update display
-        clock.tick(game_speed) # Control game speed
+        if timer:
+            t = timer.start()
+        renderer.draw(snake, game.food) # Only the changed cells
+        if timer:
+            timer.mark("draw", t)
+            if game.ticks % report_every == 0 or game_over:
+                print(timer.report()) # Log overlay with the rolling percentiles
+        clock.tick(game_speed) # Control game speed (frames per second)
 
     # --- Game Over Screen ---
-    game_over_text = font.render("GAME OVER!", True, WHITE)
+    game_over_text = font.render("YOU WIN!" if game.won else "GAME OVER!", True, WHITE)
     final_score_text = font.render(f"Final Score: {snake.score}", True, WHITE)
     
     # Format and display the end time
@@ -225,7 +212,7 @@ def main():
                 waiting_for_input = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
-                    main() # Restart the game
+                    main(ai, game_speed, timer, report_every) # Restart the game
                     waiting_for_input = False
                 elif event.key == pygame.K_q:
                     waiting_for_input = False
@@ -233,4 +220,37 @@ def main():
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Self-playing snake")
+    parser.add_argument("--headless", action="store_true", help="run games without a display at full speed")
+    parser.add_argument("--games", type=int, default=1000, help="number of headless games to play")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible headless runs")
+    parser.add_argument("--ai", choices=sorted(AI_FACTORIES), default=None,
+                        help="which AI plays the snake (default: greedy, hamiltonian for --bench-render)")
+    parser.add_argument("--speed", type=int, default=10, help="frames per second for the windowed game")
+    parser.add_argument("--bench-render", type=int, metavar="FRAMES", default=None,
+                        help="time full vs incremental rendering over this many uncapped frames")
+    parser.add_argument("--profile", action="store_true", help="time each phase of a tick and log percentiles")
+    parser.add_argument("--trace", metavar="FILE", default=None,
+                        help="also write the phase timings as a Chrome trace-event JSON file")
+    parser.add_argument("--pstats", metavar="FILE", default=None, help="run under cProfile and save pstats here")
+    args = parser.parse_args()
+
+    timer = None
+    if args.profile or args.trace:
+        timer = PhaseTimer(trace_events=1_000_000 if args.trace else 0)
+    profiler = cProfile.Profile() if args.pstats else None
+    if profiler:
+        profiler.enable()
+
+    if args.headless:
+        run_headless(args.games, args.seed, policy_factory=AI_FACTORIES[args.ai or "greedy"], timer=timer)
+    elif args.bench_render:
+        benchmark_rendering(args.bench_render, ai=args.ai or "hamiltonian", seed=args.seed or 0)
+    else:
+        main(args.ai or "greedy", args.speed, timer)
+
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.pstats)
+    if args.trace:
+        timer.write_chrome_trace(args.trace)
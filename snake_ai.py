@@ -0,0 +1,10 @@
+from snake_engine import get_safe_direction
+from snake_planner import PathPlanner
+from snake_hamiltonian import HamiltonianPlanner
+
+# AI choices: each builds a fresh policy for a game on a width x height grid
+AI_FACTORIES = {
+    "greedy": lambda width, height: get_safe_direction,
+    "astar": PathPlanner,
+    "hamiltonian": HamiltonianPlanner,
+}
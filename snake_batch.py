@@ -0,0 +1,194 @@
+import argparse
+import time
+
+import numpy as np
+
+from snake_engine import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeGame, get_safe_direction
+
+# Direction tables indexed like snake_engine.DIRECTIONS (UP, DOWN, LEFT, RIGHT)
+DX = np.array([d[0] for d in DIRECTIONS], dtype=np.int32)
+DY = np.array([d[1] for d in DIRECTIONS], dtype=np.int32)
+OPPOSITE = np.array([DIRECTIONS.index((-d[0], -d[1])) for d in DIRECTIONS], dtype=np.int8)
+
+# --- Batched Environment ---
+class BatchSnakeEnv:
+    """Many independent snake games stepped in lockstep with NumPy.
+
+    Follows the snake_engine rules: 180-degree turns are ignored, the tail
+    moves out of the way unless the snake is growing, and food is eaten the
+    tick the head lands on it. Finished games are reset inside step(), so the
+    batch never has to wait for its slowest game.
+    """
+
+    def __init__(self, num_envs, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None, max_idle_ticks=None):
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.rng = np.random.default_rng(seed)
+        # Ticks without eating before a game is called (stops endless circling)
+        self.max_idle_ticks = max_idle_ticks if max_idle_ticks is not None else self.cells * 2
+        self.rows = np.arange(num_envs)
+
+        self.head_x = np.zeros(num_envs, dtype=np.int32)
+        self.head_y = np.zeros(num_envs, dtype=np.int32)
+        self.direction = np.zeros(num_envs, dtype=np.int8)
+        # Body as a ring buffer of cell indices; the head sits at head_ptr
+        self.body = np.zeros((num_envs, self.cells), dtype=np.int32)
+        self.head_ptr = np.zeros(num_envs, dtype=np.int32)
+        self.length = np.zeros(num_envs, dtype=np.int32)
+        self.occupied = np.zeros((num_envs, self.cells), dtype=bool)
+        self.food = np.zeros(num_envs, dtype=np.int32)
+        self.grow_pending = np.zeros(num_envs, dtype=bool)
+        self.score = np.zeros(num_envs, dtype=np.int32)
+        self.ticks = np.zeros(num_envs, dtype=np.int32)
+        self.idle_ticks = np.zeros(num_envs, dtype=np.int32)
+
+        self.reset()
+
+    def reset(self, mask=None):
+        """Start new games for every env where mask is True (all envs if None)."""
+        idx = self.rows if mask is None else np.flatnonzero(mask)
+        if idx.size == 0:
+            return
+        start = (self.height // 2) * self.width + self.width // 2
+        self.head_x[idx] = self.width // 2
+        self.head_y[idx] = self.height // 2
+        self.direction[idx] = self.rng.integers(0, 4, size=idx.size)
+        self.occupied[idx] = False
+        self.occupied[idx, start] = True
+        self.head_ptr[idx] = 0
+        self.body[idx, 0] = start
+        self.length[idx] = 1
+        self.grow_pending[idx] = False
+        self.score[idx] = 0
+        self.ticks[idx] = 0
+        self.idle_ticks[idx] = 0
+        self.spawn_food(idx)
+
+    def spawn_food(self, idx):
+        """Put food on a uniformly random free cell for each env in idx."""
+        free = ~self.occupied[idx]
+        # Pick the k-th free cell per row without a Python loop
+        k = (self.rng.random(idx.size) * free.sum(axis=1)).astype(np.int32)
+        self.food[idx] = np.argmax(np.cumsum(free, axis=1) > k[:, None], axis=1)
+
+    def step(self, actions):
+        """Advance every game by one tick.
+
+        actions holds one index into DIRECTIONS per env. Returns (rewards,
+        dones, final_scores): +1 for food and -1 for dying, which games ended
+        this tick, and the score each finished game ended with (0 elsewhere).
+        """
+        rows = self.rows
+        actions = np.asarray(actions, dtype=np.int8)
+        # Prevent immediate 180-degree turns
+        self.direction = np.where(OPPOSITE[actions] == self.direction, self.direction, actions)
+
+        new_x = self.head_x + DX[self.direction]
+        new_y = self.head_y + DY[self.direction]
+        wall = (new_x < 0) | (new_x >= self.width) | (new_y < 0) | (new_y >= self.height)
+        new_cell = np.where(wall, 0, new_y * self.width + new_x)
+
+        # Remove tails first so moving into the old tail cell is allowed
+        popping = ~self.grow_pending
+        tail_slot = (self.head_ptr - self.length + 1) % self.cells
+        self.occupied[rows[popping], self.body[rows[popping], tail_slot[popping]]] = False
+        self.length += self.grow_pending
+        self.grow_pending[:] = False
+
+        self_hit = ~wall & self.occupied[rows, new_cell]
+        dead = wall | self_hit
+        alive = ~dead
+
+        # Add the new heads
+        self.head_ptr = (self.head_ptr + 1) % self.cells
+        self.body[rows, self.head_ptr] = new_cell
+        self.occupied[rows[alive], new_cell[alive]] = True
+        self.head_x = np.where(alive, new_x, self.head_x)
+        self.head_y = np.where(alive, new_y, self.head_y)
+        self.ticks += 1
+
+        ate = alive & (new_cell == self.food)
+        self.score += ate
+        self.grow_pending = ate
+        self.idle_ticks = np.where(ate, 0, self.idle_ticks + 1)
+
+        won = ate & (self.length >= self.cells)
+        starved = alive & (self.idle_ticks >= self.max_idle_ticks)
+        respawn = ate & ~won
+        if respawn.any():
+            self.spawn_food(np.flatnonzero(respawn))
+
+        dones = dead | won | starved
+        rewards = ate.astype(np.float32) - dead
+        final_scores = np.where(dones, self.score, 0)
+        if dones.any():
+            self.reset(dones)
+        return rewards, dones, final_scores
+
+    def tail_cells(self):
+        return self.body[self.rows, (self.head_ptr - self.length + 1) % self.cells]
+
+    def greedy_actions(self):
+        """Vectorized get_safe_direction: the safe move closest to the food."""
+        next_x = self.head_x[:, None] + DX[None, :]
+        next_y = self.head_y[:, None] + DY[None, :]
+        inside = (next_x >= 0) & (next_x < self.width) & (next_y >= 0) & (next_y < self.height)
+        cells = np.where(inside, next_y * self.width + next_x, 0)
+
+        # The tail cell is free next tick unless the snake is growing
+        blocked = self.occupied[self.rows[:, None], cells]
+        blocked &= ~((cells == self.tail_cells()[:, None]) & ~self.grow_pending[:, None])
+        safe = inside & ~blocked & (np.arange(4)[None, :] != OPPOSITE[self.direction][:, None])
+
+        food_x = (self.food % self.width)[:, None]
+        food_y = (self.food // self.width)[:, None]
+        distance = np.abs(food_x - next_x) + np.abs(food_y - next_y)
+        # Random jitter breaks ties like the shuffle in get_safe_direction
+        cost = np.where(safe, distance + self.rng.random((self.num_envs, 4)) * 0.5, np.inf)
+        return np.argmin(cost, axis=1).astype(np.int8)
+
+    def grids(self):
+        """Boards as (num_envs, height, width) int8: 1 body, 2 head, 3 food."""
+        grid = self.occupied.astype(np.int8)
+        grid[self.rows, self.body[self.rows, self.head_ptr]] = 2
+        grid[self.rows, self.food] = 3
+        return grid.reshape(self.num_envs, self.height, self.width)
+
+# --- Benchmark ---
+def benchmark(num_envs=1024, steps=500, seed=0):
+    """Compare env-steps/sec of the batch against looping over SnakeGame objects."""
+    env = BatchSnakeEnv(num_envs, seed=seed)
+    start = time.perf_counter()
+    finished = 0
+    for _ in range(steps):
+        _, dones, _ = env.step(env.greedy_actions())
+        finished += int(dones.sum())
+    batch_elapsed = time.perf_counter() - start
+    batch_rate = num_envs * steps / batch_elapsed
+
+    # Same greedy AI through the per-object engine, resetting finished games
+    games = [SnakeGame(seed + i, max_idle_ticks=GRID_WIDTH * GRID_HEIGHT * 2) for i in range(num_envs)]
+    loop_steps = max(1, steps // 10)
+    start = time.perf_counter()
+    for _ in range(loop_steps):
+        for i, game in enumerate(games):
+            game.step(get_safe_direction(game.snake, game.food))
+            if game.game_over:
+                games[i] = SnakeGame(game.seed + num_envs, max_idle_ticks=game.max_idle_ticks)
+    loop_elapsed = time.perf_counter() - start
+    loop_rate = num_envs * loop_steps / loop_elapsed
+
+    print(f"Batch of {num_envs}: {batch_rate:,.0f} env-steps/sec ({finished} games finished)")
+    print(f"Per-object loop:  {loop_rate:,.0f} env-steps/sec")
+    print(f"Speed-up: {batch_rate / loop_rate:.1f}x")
+    return {"batch_steps_per_sec": batch_rate, "loop_steps_per_sec": loop_rate}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the batched NumPy snake environment")
+    parser.add_argument("--envs", type=int, default=1024, help="games stepped in lockstep")
+    parser.add_argument("--steps", type=int, default=500, help="batch steps to time")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    benchmark(args.envs, args.steps, args.seed)
@@ -0,0 +1,287 @@
+import random
+import collections
+import time
+
+# --- Grid Constants ---
+GRID_WIDTH = 30
+GRID_HEIGHT = 20
+
+# Directions
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+
+# --- Snake Class ---
+class Snake:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, rng=None):
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random.Random()
+        # Initial position in the middle of the grid
+        self.body = collections.deque([(width // 2, height // 2)])
+        self.direction = self.rng.choice(DIRECTIONS)
+        # The AI gets its own stream so food spawns depend only on the seed and
+        # the moves made, which is what lets a replay rebuild the game
+        self.ai_rng = random.Random(self.rng.getrandbits(32))
+        self.score = 0
+        self.grow_pending = False # Flag to indicate if snake should grow
+
+        # Occupancy grid kept in step with the body: one byte per cell counting
+        # the segments on it, so collision checks never scan the deque
+        self.occupied = bytearray(width * height)
+        # Free cells as a swap-remove list plus each cell's slot in it, so food
+        # can pick a random free cell in O(1) however full the board is
+        self.free_cells = list(range(width * height))
+        self.free_slot = list(range(width * height))
+        self.occupy(self.body[0][1] * width + self.body[0][0])
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def occupy(self, cell):
+        self.occupied[cell] += 1
+        if self.occupied[cell] == 1:
+            # Swap the last free cell into this cell's slot
+            slot = self.free_slot[cell]
+            last = self.free_cells.pop()
+            if last != cell:
+                self.free_cells[slot] = last
+                self.free_slot[last] = slot
+
+    def vacate(self, cell):
+        self.occupied[cell] -= 1
+        if self.occupied[cell] == 0:
+            self.free_slot[cell] = len(self.free_cells)
+            self.free_cells.append(cell)
+
+    def move(self):
+        # Calculate new head position
+        head_x, head_y = self.body[0]
+        new_head = (head_x + self.direction[0], head_y + self.direction[1])
+        self.body.appendleft(new_head) # Add new head
+        if self.in_bounds(new_head):
+            self.occupy(new_head[1] * self.width + new_head[0])
+
+        if not self.grow_pending:
+            tail = self.body.pop() # Remove tail if not growing
+            if self.in_bounds(tail):
+                self.vacate(tail[1] * self.width + tail[0])
+        else:
+            self.grow_pending = False # Reset grow flag
+
+    def change_direction(self, new_direction):
+        # Prevent immediate 180-degree turns
+        if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
+            self.direction = new_direction
+
+    def grow(self):
+        self.grow_pending = True
+        self.score += 1
+
+    def check_collision(self):
+        head_x, head_y = self.body[0]
+
+        # Wall collision
+        if not (0 <= head_x < self.width and 0 <= head_y < self.height):
+            return True
+
+        # Self-collision (the head shares its cell with another segment)
+        if self.occupied[head_y * self.width + head_x] > 1:
+            return True
+
+        return False
+
+    def is_safe(self, pos):
+        """Return True if moving the head onto pos next tick would not collide."""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if not self.occupied[y * self.width + x]:
+            return True
+        # The tail cell is free next tick unless the snake is about to grow
+        return not self.grow_pending and pos == self.body[-1]
+
+# --- Food Class ---
+class Food:
+    def __init__(self, snake):
+        self.position = self.generate_position(snake)
+
+    def generate_position(self, snake):
+        """Pick a random free cell, or None when the snake fills the board."""
+        if not snake.free_cells:
+            return None
+        cell = snake.free_cells[snake.rng.randrange(len(snake.free_cells))]
+        return (cell % snake.width, cell // snake.width)
+
+# --- AI Logic (Simple Greedy Pathfinding) ---
+def get_safe_direction(snake, food):
+    # Get current head position
+    head_x, head_y = snake.body[0]
+
+    # Possible directions
+    possible_directions = list(DIRECTIONS)
+    snake.ai_rng.shuffle(possible_directions) # Shuffle to add some randomness if multiple paths are equally good
+
+    best_direction = snake.direction # Default to current direction if no better path found
+
+    # Calculate distance to food for each possible move
+    min_distance = float('inf')
+
+    for dx, dy in possible_directions:
+        next_x, next_y = head_x + dx, head_y + dy
+
+        # Check for immediate collision with walls or self
+        if not snake.is_safe((next_x, next_y)):
+            continue # Skip if it leads to a collision
+
+        # If it's a safe move, calculate distance to food
+        distance = abs(food.position[0] - next_x) + abs(food.position[1] - next_y)
+
+        # Prioritize moves that get closer to food
+        if distance < min_distance:
+            min_distance = distance
+            best_direction = (dx, dy)
+        elif distance == min_distance:
+            # If distances are equal, prefer continuing in the same general direction
+            # This helps prevent unnecessary zig-zagging
+            if (dx, dy) == snake.direction:
+                best_direction = (dx, dy)
+
+    # If no safe path to food, try to find any safe path to survive
+    if best_direction == snake.direction: # Means no better path was found based on food distance
+        for dx, dy in possible_directions:
+            if not snake.is_safe((head_x + dx, head_y + dy)):
+                continue
+
+            return (dx, dy) # Return the first safe direction found
+
+    return best_direction
+
+# --- Game Engine ---
+class SnakeGame:
+    """One game of snake with no rendering: call step() until game_over is set."""
+
+    def __init__(self, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 policy=get_safe_direction, max_idle_ticks=None, timer=None):
+        if seed is None:
+            seed = random.getrandbits(32) # Always keep a seed so the game can be replayed
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.policy = policy
+        # Ticks allowed without eating before the game is called (None = unlimited)
+        self.max_idle_ticks = max_idle_ticks
+        self.snake = Snake(width, height, self.rng)
+        self.food = Food(self.snake)
+        self.ticks = 0
+        self.idle_ticks = 0
+        self.game_over = False
+        self.won = False
+        self.death_cause = None # "wall", "self", "starved" or "won" once the game ends
+        self.timer = timer # Optional snake_profile.PhaseTimer
+
+    def step(self, direction=None):
+        """Advance the game by one tick.
+
+        If no direction is given the policy picks one. Returns True if food was eaten.
+        """
+        if self.game_over:
+            return False
+        timer = self.timer
+        if timer:
+            t = timer.start()
+
+        if direction is None:
+            direction = self.policy(self.snake, self.food)
+            if timer:
+                t = timer.mark("ai", t)
+        self.snake.change_direction(direction)
+        self.snake.move()
+        self.ticks += 1
+        if timer:
+            t = timer.mark("move", t)
+
+        ate = False
+        # Check for eating food
+        if self.snake.body[0] == self.food.position:
+            self.snake.grow()
+            self.idle_ticks = 0
+            ate = True
+            food = Food(self.snake) # Generate new food
+            if timer:
+                t = timer.mark("food", t)
+            if food.position is None:
+                # Board is full: nowhere left to put food
+                self.won = True
+                self.game_over = True
+                self.death_cause = "won"
+                return ate
+            self.food = food
+        else:
+            self.idle_ticks += 1
+
+        # Check for collision after moving
+        if self.snake.check_collision():
+            self.game_over = True
+            self.death_cause = "self" if self.snake.in_bounds(self.snake.body[0]) else "wall"
+        elif self.max_idle_ticks is not None and self.idle_ticks >= self.max_idle_ticks:
+            self.game_over = True
+            self.death_cause = "starved"
+        if timer:
+            timer.mark("collision", t)
+
+        return ate
+
+    def run(self):
+        """Play the game to the end and return the final score."""
+        while not self.game_over:
+            self.step()
+        return self.snake.score
+
+# --- Headless Runner ---
+def run_headless(games=1000, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT, policy_factory=None,
+                 timer=None):
+    """Play many games back to back at full CPU speed and report throughput.
+
+    policy_factory(width, height) builds the AI for each game; the greedy
+    get_safe_direction is used when it is None. A PhaseTimer passed as timer
+    is shared by every game and its report printed at the end.
+    """
+    master = random.Random(seed)
+    # Stop games where the AI circles forever without reaching the food
+    max_idle_ticks = width * height * 2
+
+    total_ticks = 0
+    total_score = 0
+    plan_seconds = 0.0
+    plan_calls = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        policy = policy_factory(width, height) if policy_factory else get_safe_direction
+        game = SnakeGame(master.getrandbits(32), width, height, policy=policy, max_idle_ticks=max_idle_ticks,
+                         timer=timer)
+        total_score += game.run()
+        total_ticks += game.ticks
+        # Planners that time themselves expose plan_seconds / calls
+        plan_seconds += getattr(policy, "plan_seconds", 0.0)
+        plan_calls += getattr(policy, "calls", 0)
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        "games": games,
+        "ticks": total_ticks,
+        "seconds": elapsed,
+        "games_per_sec": games / elapsed if elapsed else float('inf'),
+        "ticks_per_sec": total_ticks / elapsed if elapsed else float('inf'),
+        "mean_score": total_score / games if games else 0.0,
+    }
+    print(f"Played {games} games ({total_ticks} ticks) in {elapsed:.2f}s")
+    print(f"{stats['games_per_sec']:.1f} games/sec, {stats['ticks_per_sec']:.0f} ticks/sec, "
+          f"mean score {stats['mean_score']:.2f}")
+    if plan_calls:
+        stats["plan_us_per_tick"] = plan_seconds / plan_calls * 1e6
+        print(f"Planning: {stats['plan_us_per_tick']:.1f} us/tick")
+    if timer:
+        print(timer.report())
+    return stats
@@ -0,0 +1,193 @@
+import argparse
+import array
+import functools
+import os
+import random
+import time
+
+from snake_engine import GRID_WIDTH, GRID_HEIGHT, SnakeGame, get_safe_direction
+
+# Cycles are written here once per grid size and reused by later runs
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snake_cache")
+
+# --- Cycle Construction ---
+def build_cycle(width, height):
+    """Return the cells of a Hamiltonian cycle as a list of (x, y).
+
+    Runs right along the top row, zig-zags back through the remaining rows
+    (leaving column 0 free) and returns up column 0. Needs an even number of
+    rows; an even number of columns works by transposing.
+    """
+    if width < 2 or height < 2 or (width % 2 and height % 2):
+        raise ValueError(f"No Hamiltonian cycle on a {width}x{height} grid")
+    if height % 2:
+        return [(y, x) for x, y in build_cycle(height, width)]
+
+    cells = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        columns = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cells.extend((x, y) for x in columns)
+    cells.extend((0, y) for y in range(height - 1, 0, -1))
+    return cells
+
+def is_cycle(order, width, height):
+    """Whether order (cycle position per cell) really is a Hamiltonian cycle of the grid."""
+    cells = width * height
+    if len(order) != cells or sorted(order) != list(range(cells)):
+        return False
+    cell_at = [0] * cells
+    for cell, position in enumerate(order):
+        cell_at[position] = cell
+    for position in range(cells):
+        a, b = cell_at[position], cell_at[(position + 1) % cells]
+        ax, ay, bx, by = a % width, a // width, b % width, b // width
+        if abs(ax - bx) + abs(ay - by) != 1:
+            return False
+    return True
+
+@functools.lru_cache(maxsize=None)
+def load_cycle(width, height):
+    """Cycle position of every cell (indexed y * width + x), cached on disk."""
+    path = os.path.join(CACHE_DIR, f"hamiltonian_{width}x{height}.bin")
+    order = array.array('H')
+    try:
+        with open(path, 'rb') as f:
+            order.frombytes(f.read())
+        # Safety depends on this being a real cycle, so a stale or corrupt file is rebuilt
+        if is_cycle(order, width, height):
+            return order
+    except (OSError, ValueError):
+        pass
+
+    order = array.array('H', bytes(2 * width * height))
+    for position, (x, y) in enumerate(build_cycle(width, height)):
+        order[y * width + x] = position
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(order.tobytes())
+    except OSError:
+        pass # Read-only install: keep the in-memory copy
+    return order
+
+# --- Cycle Policy ---
+class HamiltonianPlanner:
+    """Perfect-play policy that always stays safe by following a Hamiltonian cycle.
+
+    The body always lies on the stretch of the cycle from the tail to the head,
+    so any move that lands ahead of the head and behind the tail is safe. While
+    the snake is short that lets it skip along the cycle straight to the food.
+    """
+
+    def __init__(self, width, height, shortcuts=True, shortcut_limit=0.5):
+        self.width = width
+        self.height = height
+        self.order = load_cycle(width, height)
+        self.cells = width * height
+        self.shortcuts = shortcuts
+        # Stop taking shortcuts once the snake fills this share of the board
+        self.shortcut_limit = shortcut_limit
+
+    def distance(self, a, b):
+        """Steps from cell a to cell b going forward along the cycle."""
+        return (self.order[b[1] * self.width + b[0]] - self.order[a[1] * self.width + a[0]]) % self.cells
+
+    def __call__(self, snake, food):
+        head = snake.body[0]
+        reverse = (-snake.direction[0], -snake.direction[1])
+        length = len(snake.body)
+
+        # Free cells ahead of the head before the cycle reaches the tail
+        room = self.distance(head, snake.body[-1]) if length > 1 else self.cells
+        to_food = self.distance(head, food.position)
+        allow_shortcut = self.shortcuts and length < self.cells * self.shortcut_limit
+
+        best_direction = None
+        best_progress = 0
+        for direction in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            if direction == reverse:
+                continue # change_direction ignores 180-degree turns
+            nx, ny = head[0] + direction[0], head[1] + direction[1]
+            if not (0 <= nx < self.width and 0 <= ny < self.height):
+                continue
+            progress = self.distance(head, (nx, ny))
+            if progress == 1:
+                # The next cell on the cycle is always safe
+                if best_direction is None:
+                    best_direction, best_progress = direction, progress
+                continue
+            # Leave a margin so growing after the shortcut can't close the gap to the tail
+            if not allow_shortcut or progress >= room - 2 or progress > to_food:
+                continue
+            if progress > best_progress:
+                best_direction, best_progress = direction, progress
+
+        if best_direction is None:
+            # Only possible while the snake is one cell long and the cycle runs behind it.
+            # At length 1 any in-bounds forward or sideways move is safe, so take the
+            # one that rejoins the cycle soonest
+            best_distance = None
+            for direction in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                nx, ny = head[0] + direction[0], head[1] + direction[1]
+                if direction == reverse or not (0 <= nx < self.width and 0 <= ny < self.height):
+                    continue
+                distance = self.distance(head, (nx, ny))
+                if best_distance is None or distance < best_distance:
+                    best_direction, best_distance = direction, distance
+        return best_direction
+
+# --- Benchmark ---
+def benchmark(games=5, seed=0, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """Compare ticks-to-win and wall-clock time per game across AIs."""
+    policies = {
+        "greedy": lambda: get_safe_direction,
+        "cycle": lambda: HamiltonianPlanner(width, height, shortcuts=False),
+        "cycle+shortcuts": lambda: HamiltonianPlanner(width, height),
+    }
+    load_cycle(width, height) # Keep the one-off cycle build out of the timings
+
+    print(f"{'AI':<16}{'wins':>6}{'mean ticks':>12}{'mean score':>12}{'s/game':>10}")
+    results = {}
+    for name, make_policy in policies.items():
+        master = random.Random(seed)
+        wins = ticks = score = 0
+        start = time.perf_counter()
+        for _ in range(games):
+            game = SnakeGame(master.getrandbits(32), width, height, policy=make_policy(),
+                             max_idle_ticks=width * height * 2)
+            score += game.run()
+            ticks += game.ticks
+            wins += game.won
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "wins": wins,
+            "mean_ticks": ticks / games,
+            "mean_score": score / games,
+            "seconds_per_game": elapsed / games,
+        }
+        print(f"{name:<16}{wins:>6}{ticks / games:>12.0f}{score / games:>12.1f}{elapsed / games:>10.3f}")
+    return results
+
+def check_fills_board(seeds=50, sizes=((8, 6), (10, 10), (12, 8), (6, 4))):
+    """Regression check: the planner must win every game on small even grids."""
+    for width, height in sizes:
+        for seed in range(seeds):
+            game = SnakeGame(seed, width, height, policy=HamiltonianPlanner(width, height),
+                             max_idle_ticks=width * height * 2)
+            game.run()
+            assert game.won, f"lost on {width}x{height} seed {seed}: {game.death_cause}"
+    print(f"won all {seeds * len(sizes)} games on {', '.join(f'{w}x{h}' for w, h in sizes)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Hamiltonian-cycle snake play")
+    parser.add_argument("--games", type=int, default=5, help="games per AI")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the game sequence")
+    parser.add_argument("--width", type=int, default=GRID_WIDTH)
+    parser.add_argument("--height", type=int, default=GRID_HEIGHT)
+    parser.add_argument("--check", action="store_true", help="check the planner wins on small grids")
+    args = parser.parse_args()
+    if args.check:
+        check_fills_board()
+    else:
+        benchmark(args.games, args.seed, args.width, args.height)
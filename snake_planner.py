@@ -0,0 +1,177 @@
+import functools
+import heapq
+import time
+
+from snake_engine import DIRECTIONS, get_safe_direction
+
+# --- Grid Graph ---
+@functools.lru_cache(maxsize=None)
+def build_grid_graph(width, height):
+    """Precompute the neighbours of every cell as (cell index, direction) pairs.
+
+    Cached per grid size, so every planner on the same grid shares one graph.
+    """
+    graph = []
+    for idx in range(width * height):
+        x, y = idx % width, idx // width
+        edges = []
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                edges.append((ny * width + nx, (dx, dy)))
+        graph.append(edges)
+    return graph
+
+# --- A* Planner ---
+class PathPlanner:
+    """A* policy for the snake engine.
+
+    Plans a path to the food, keeps it across ticks and only replans when the
+    food moves or the next step is blocked. If the food can't be reached
+    safely the snake stalls: it takes the safe move that keeps its tail
+    reachable and ends up farthest from it, so the body uncoils and frees up
+    room. An instance is callable
+    with the same (snake, food) signature as get_safe_direction; use a fresh
+    instance per game since it caches the plan.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.graph = build_grid_graph(width, height)
+        self.path = [] # Planned directions, next move last
+        self.target = None # Food position the cached path leads to
+
+        # Timing stats
+        self.plan_seconds = 0.0
+        self.calls = 0
+        self.replans = 0
+
+    def __call__(self, snake, food):
+        start = time.perf_counter()
+        direction = self.next_direction(snake, food)
+        self.plan_seconds += time.perf_counter() - start
+        self.calls += 1
+        return direction
+
+    def next_direction(self, snake, food):
+        head_x, head_y = snake.body[0]
+
+        # Keep following the cached path while it still leads to the same food
+        if self.path and self.target == food.position:
+            dx, dy = self.path[-1]
+            if snake.is_safe((head_x + dx, head_y + dy)):
+                return self.path.pop()
+
+        self.replans += 1
+        self.path = []
+        self.target = None
+
+        body = list(snake.body)
+        free_at = self.free_at(body, snake.grow_pending)
+        head = head_y * self.width + head_x
+        goal = food.position[1] * self.width + food.position[0]
+        reverse = (-snake.direction[0], -snake.direction[1])
+
+        cells = self.astar(head, goal, free_at, reverse)
+        if cells is not None and self.tail_reachable(body, snake.grow_pending, cells):
+            self.path = self.to_directions(head, cells)
+            self.target = food.position
+            return self.path.pop()
+
+        # Fallback: of the moves that keep the tail reachable, take the one farthest
+        # from it. Chasing the tail by the shortest path keeps the body coiled up
+        best_direction = None
+        best_distance = -1
+        for neighbour, direction in self.graph[head]:
+            if direction == reverse or free_at[neighbour] > 1:
+                continue
+            distance = self.tail_distance(body, snake.grow_pending, [neighbour])
+            if distance is not None and distance > best_distance:
+                best_direction, best_distance = direction, distance
+        if best_direction is not None:
+            return best_direction
+
+        # Nothing reachable: just survive this tick
+        return get_safe_direction(snake, food)
+
+    def free_at(self, body, grow_pending):
+        """Tick at which each cell is free to enter (0 for empty cells).
+
+        The segment at body index i leaves its cell after len(body) - i moves,
+        one move later if the snake is about to grow.
+        """
+        free_at = [0] * (self.width * self.height)
+        n = len(body) + (1 if grow_pending else 0)
+        for i, (x, y) in enumerate(body):
+            if 0 <= x < self.width and 0 <= y < self.height:
+                free_at[y * self.width + x] = n - i
+        return free_at
+
+    def astar(self, start, goal, free_at, banned=None):
+        """Shortest list of cells from start (exclusive) to goal, or None."""
+        width = self.width
+        graph = self.graph
+        goal_x, goal_y = goal % width, goal // width
+
+        came_from = {start: None}
+        best_g = {start: 0}
+        open_heap = [(abs(start % width - goal_x) + abs(start // width - goal_y), 0, start)]
+        while open_heap:
+            _, g, cell = heapq.heappop(open_heap)
+            if cell == goal:
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return path
+            if g > best_g[cell]:
+                continue # Stale heap entry
+
+            for neighbour, direction in graph[cell]:
+                if cell == start and direction == banned:
+                    continue # The snake can't turn back on itself
+                step = g + 1
+                # Body segments clear out as the snake moves
+                if free_at[neighbour] > step:
+                    continue
+                if step < best_g.get(neighbour, step + 1):
+                    best_g[neighbour] = step
+                    came_from[neighbour] = cell
+                    h = abs(neighbour % width - goal_x) + abs(neighbour // width - goal_y)
+                    heapq.heappush(open_heap, (step + h, step, neighbour))
+        return None
+
+    def tail_reachable(self, body, grow_pending, cells):
+        """Check the snake can still reach its tail after eating at the end of cells."""
+        return self.tail_distance(body, grow_pending, cells) is not None
+
+    def tail_distance(self, body, grow_pending, cells):
+        """Steps from head to tail after moving along cells and growing, or None if cut off."""
+        width = self.width
+        # Body at the moment the food is eaten: newest cells first
+        new_body = [(c % width, c // width) for c in reversed(cells)] + body
+        new_body = new_body[:len(body) + (1 if grow_pending else 0)]
+        if len(new_body) < 3:
+            return 0
+
+        new_head = new_body[0][1] * width + new_body[0][0]
+        new_tail = new_body[-1][1] * width + new_body[-1][0]
+        neck = new_body[1]
+        banned = (new_body[0][0] - neck[0], new_body[0][1] - neck[1])
+        banned = (-banned[0], -banned[1])
+        free_at = self.free_at(new_body, True)
+        path = self.astar(new_head, new_tail, free_at, banned)
+        return None if path is None else len(path)
+
+    def to_directions(self, start, cells):
+        """Turn a list of cells into moves, with the first move at the end for pop()."""
+        width = self.width
+        directions = []
+        prev = start
+        for cell in cells:
+            directions.append((cell % width - prev % width, cell // width - prev // width))
+            prev = cell
+        directions.reverse()
+        return directions
@@ -0,0 +1,67 @@
+import collections
+import json
+import time
+
+# --- Phase Timing ---
+class PhaseTimer:
+    """High-resolution per-phase timers for the snake loop.
+
+    Code being timed calls start() once and then mark(phase, t) at the end of
+    each phase; mark returns the new timestamp so phases chain without extra
+    clock reads. The last `window` samples of every phase are kept for rolling
+    percentiles, and up to `trace_events` spans can be kept for a Chrome trace.
+    Anything that accepts a timer skips all of this when it is None.
+    """
+
+    def __init__(self, window=10000, trace_events=0):
+        self.clock = time.perf_counter
+        self.window = window
+        self.samples = {} # phase -> deque of durations in seconds
+        self.totals = collections.Counter()
+        self.counts = collections.Counter()
+        self.max_trace_events = trace_events
+        self.trace = [] if trace_events else None
+        self.origin = self.clock()
+
+    def start(self):
+        return self.clock()
+
+    def mark(self, phase, start):
+        now = self.clock()
+        elapsed = now - start
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = collections.deque(maxlen=self.window)
+        samples.append(elapsed)
+        self.totals[phase] += elapsed
+        self.counts[phase] += 1
+        if self.trace is not None and len(self.trace) < self.max_trace_events:
+            self.trace.append((phase, start, elapsed))
+        return now
+
+    def percentiles(self, phase):
+        """Rolling p50/p95/p99 (seconds) over the last `window` samples of a phase."""
+        values = sorted(self.samples.get(phase, ()))
+        if not values:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        last = len(values) - 1
+        return {f"p{p}": values[round(last * p / 100)] for p in (50, 95, 99)}
+
+    def report(self):
+        """One line per phase, slowest total first, in microseconds."""
+        lines = [f"{'phase':<10}{'calls':>10}{'total ms':>10}{'p50 us':>9}{'p95 us':>9}{'p99 us':>9}"]
+        for phase, total in self.totals.most_common():
+            pct = self.percentiles(phase)
+            lines.append(f"{phase:<10}{self.counts[phase]:>10}{total * 1e3:>10.1f}"
+                         f"{pct['p50'] * 1e6:>9.1f}{pct['p95'] * 1e6:>9.1f}{pct['p99'] * 1e6:>9.1f}")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        """Save recorded spans in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        events = [
+            {"name": phase, "ph": "X", "ts": (start - self.origin) * 1e6, "dur": elapsed * 1e6,
+             "pid": 0, "tid": 0}
+            for phase, start, elapsed in self.trace or ()
+        ]
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, f)
@@ -0,0 +1,127 @@
+import argparse
+import copy
+import struct
+
+from snake_engine import DIRECTIONS, SnakeGame
+
+# File layout: header, then one 2-bit direction index per tick, four ticks per byte
+MAGIC = b'SNKR'
+VERSION = 1
+# magic, version, width, height, initial direction, seed, max idle ticks (0 = none), ticks
+HEADER = struct.Struct('<4sBBBBQII')
+
+# --- Recording ---
+class ReplayRecorder:
+    """Wraps a SnakeGame and records the direction taken on every tick.
+
+    The seed fixes the starting direction and every food spawn, so the moves
+    are all that's needed to rebuild the game later.
+    """
+
+    def __init__(self, game):
+        if not 0 <= game.seed < 2 ** 64:
+            raise ValueError("Replays need an integer seed between 0 and 2**64 - 1")
+        self.game = game
+        self.initial_direction = DIRECTIONS.index(game.snake.direction)
+        self.actions = bytearray()
+        self.ticks = 0
+
+    def step(self, direction=None):
+        ate = self.game.step(direction)
+        # Record the direction actually taken, after 180-degree turns were refused
+        action = DIRECTIONS.index(self.game.snake.direction)
+        if self.ticks % 4 == 0:
+            self.actions.append(0)
+        self.actions[-1] |= action << (2 * (self.ticks % 4))
+        self.ticks += 1
+        return ate
+
+    def run(self):
+        while not self.game.game_over:
+            self.step()
+        return self.game.snake.score
+
+    def to_bytes(self):
+        header = HEADER.pack(MAGIC, VERSION, self.game.snake.width, self.game.snake.height,
+                             self.initial_direction, self.game.seed, self.game.max_idle_ticks or 0,
+                             self.ticks)
+        return header + bytes(self.actions)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+# --- Playback ---
+class ReplayPlayer:
+    """Rebuilds any tick of a recorded game by replaying its moves.
+
+    Snapshots of the game are kept every keyframe_interval ticks as playback
+    passes them, so seeking only replays from the nearest earlier keyframe.
+    """
+
+    def __init__(self, data, keyframe_interval=1000):
+        magic, version, width, height, initial_direction, seed, max_idle_ticks, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a snake replay file")
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.ticks = ticks
+        self.actions = data[HEADER.size:]
+        if len(self.actions) < (ticks + 3) // 4:
+            raise ValueError("Replay file is truncated")
+        self.keyframe_interval = keyframe_interval
+
+        game = SnakeGame(seed, width, height, policy=None, max_idle_ticks=max_idle_ticks or None)
+        if game.snake.direction != DIRECTIONS[initial_direction]:
+            raise ValueError("Replay does not match this version of the snake engine")
+        self.keyframes = {0: game}
+
+    @classmethod
+    def load(cls, path, keyframe_interval=1000):
+        with open(path, 'rb') as f:
+            return cls(f.read(), keyframe_interval)
+
+    def action(self, tick):
+        return DIRECTIONS[(self.actions[tick // 4] >> (2 * (tick % 4))) & 3]
+
+    def game_at(self, tick):
+        """Return a fresh SnakeGame in the state right after `tick` ticks."""
+        if not 0 <= tick <= self.ticks:
+            raise IndexError(f"Tick {tick} is outside the replay (0-{self.ticks})")
+        start = max(t for t in self.keyframes if t <= tick)
+        game = copy.deepcopy(self.keyframes[start])
+
+        for t in range(start, tick):
+            game.step(self.action(t))
+            if (t + 1) % self.keyframe_interval == 0 and t + 1 not in self.keyframes:
+                self.keyframes[t + 1] = copy.deepcopy(game)
+        return game
+
+    def final_game(self):
+        return self.game_at(self.ticks)
+
+def render_board(game):
+    """Text picture of a game: H head, o body, * food, . empty."""
+    rows = [['.'] * game.snake.width for _ in range(game.snake.height)]
+    for x, y in game.snake.body:
+        if game.snake.in_bounds((x, y)):
+            rows[y][x] = 'o'
+    head = game.snake.body[0]
+    if game.snake.in_bounds(head):
+        rows[head[1]][head[0]] = 'H'
+    if game.food.position is not None:
+        rows[game.food.position[1]][game.food.position[0]] = '*'
+    return '\n'.join(''.join(row) for row in rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect a recorded snake game")
+    parser.add_argument("replay", help="replay file written by ReplayRecorder")
+    parser.add_argument("--tick", type=int, default=None, help="tick to show (default: the last one)")
+    args = parser.parse_args()
+
+    player = ReplayPlayer.load(args.replay)
+    game = player.final_game() if args.tick is None else player.game_at(args.tick)
+    print(f"Seed {player.seed}, {player.width}x{player.height}, tick {game.ticks} of {player.ticks}")
+    print(f"Score {game.snake.score}, length {len(game.snake.body)}, ended: {game.death_cause or 'no'}")
+    print(render_board(game))
@@ -0,0 +1,124 @@
+import argparse
+import collections
+import csv
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from snake_engine import GRID_WIDTH, GRID_HEIGHT, SnakeGame
+from snake_ai import AI_FACTORIES
+from snake_replay import ReplayRecorder
+
+METRICS = ["score", "length", "ticks"]
+PERCENTILES = [5, 25, 50, 75, 90, 95, 99]
+
+# --- Worker ---
+def play_game(job):
+    """Play one seeded headless game. Runs inside a pool worker."""
+    index, seed, ai, width, height, replay_dir = job
+    game = SnakeGame(seed, width, height, policy=AI_FACTORIES[ai](width, height),
+                     max_idle_ticks=width * height * 2)
+    if replay_dir:
+        recorder = ReplayRecorder(game)
+        recorder.run()
+        recorder.save(os.path.join(replay_dir, f"game_{index:06d}.snkr"))
+    else:
+        game.run()
+    return {
+        "game": index,
+        "seed": seed,
+        "score": game.snake.score,
+        "length": len(game.snake.body),
+        "ticks": game.ticks,
+        "death_cause": game.death_cause,
+    }
+
+# --- Tournament ---
+def make_jobs(games, seed, ai, width=GRID_WIDTH, height=GRID_HEIGHT, replay_dir=None):
+    """Derive one seed per game from the tournament seed, so results don't depend on scheduling."""
+    master = random.Random(seed)
+    return [(index, master.getrandbits(32), ai, width, height, replay_dir) for index in range(games)]
+
+def run_tournament(games=1000, seed=0, ai="greedy", processes=None, width=GRID_WIDTH, height=GRID_HEIGHT,
+                   replay_dir=None):
+    """Spread the games over a process pool and return per-game results in game order.
+
+    With replay_dir set, every game is also saved there as a compact replay.
+    """
+    if replay_dir:
+        os.makedirs(replay_dir, exist_ok=True)
+    jobs = make_jobs(games, seed, ai, width, height, replay_dir)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        return [play_game(job) for job in jobs]
+
+    # Large chunks keep IPC overhead low; several per worker balances long games
+    chunksize = max(1, games // (processes * 8))
+    with multiprocessing.Pool(processes) as pool:
+        return list(pool.imap(play_game, jobs, chunksize=chunksize))
+
+# --- Statistics ---
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+def summarize(results):
+    """Percentile summary of every metric plus death-cause counts."""
+    summary = {"games": len(results)}
+    for metric in METRICS:
+        values = sorted(result[metric] for result in results)
+        stats = {
+            "min": values[0] if values else 0,
+            "mean": sum(values) / len(values) if values else 0.0,
+            "max": values[-1] if values else 0,
+        }
+        for pct in PERCENTILES:
+            stats[f"p{pct}"] = percentile(values, pct)
+        summary[metric] = stats
+    summary["death_causes"] = dict(sorted(collections.Counter(r["death_cause"] for r in results).items()))
+    return summary
+
+def write_results(results, summary, summary_path, games_path=None):
+    with open(summary_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    if games_path:
+        with open(games_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=["game", "seed"] + METRICS + ["death_cause"])
+            writer.writeheader()
+            writer.writerows(results)
+
+def print_summary(summary):
+    columns = ["min"] + [f"p{pct}" for pct in PERCENTILES] + ["max", "mean"]
+    print(f"{'metric':<8}" + "".join(f"{c:>9}" for c in columns))
+    for metric in METRICS:
+        print(f"{metric:<8}" + "".join(f"{summary[metric][c]:>9.1f}" for c in columns))
+    causes = ", ".join(f"{cause}: {count}" for cause, count in summary["death_causes"].items())
+    print(f"Death causes: {causes}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play a seeded snake tournament across a process pool")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="tournament seed; same seed gives the same results")
+    parser.add_argument("--ai", choices=sorted(AI_FACTORIES), default="greedy", help="which AI plays")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--summary", default="tournament_summary.json", help="where to write the percentile summary")
+    parser.add_argument("--csv", default=None, help="optional per-game CSV output")
+    parser.add_argument("--replay-dir", default=None, help="save a replay of every game in this directory")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_tournament(args.games, args.seed, args.ai, args.processes, replay_dir=args.replay_dir)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    summary.update({"ai": args.ai, "seed": args.seed})
+    write_results(results, summary, args.summary, args.csv)
+    print_summary(summary)
+    print(f"{args.games} games in {elapsed:.2f}s ({args.games / elapsed:.1f} games/sec)")